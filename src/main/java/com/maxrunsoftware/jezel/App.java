@@ -61,38 +61,43 @@ public class App {
 		else serverType = trimOrNull(args[0]);
 		if (serverType == null) serverType = "Not Specified";
 
-		if (serverType.equalsIgnoreCase("web")) {
-			var settings = new SettingServiceEnvironment();
-			var webServer = new WebServer(settings, new DataService(new RestClient(settings)));
-			try {
-				webServer.start(true);
-			} catch (Exception e) {
-				LOG.error("Error in Web server", e);
-			}
-		} else if (serverType.equalsIgnoreCase("rest")) {
-			var module = new AbstractModule() {
-				@SuppressWarnings("unchecked")
-				@Override
-				protected void configure() {
-					for (var bnd : Constant.BINDS) {
-						if (bnd.singleton()) {
-							bind(bnd.classInterface()).to(bnd.classImplementation()).in(Singleton.class);
-						} else {
-							bind(bnd.classInterface()).to(bnd.classImplementation());
-						}
-					}
-				}
-			};
-			Constant.setInjector(Guice.createInjector(module));
-
-			var app = Constant.getInstance(App.class);
+		switch (serverType.toLowerCase()) {
+			case "web" -> runWeb();
+			case "rest" -> runRest(args);
+			default -> LOG.error("Valid server types are WEB or REST");
+		}
 
-			app.run(args);
+	}
 
-		} else {
-			LOG.error("Valid server types are WEB or REST");
+	private static void runWeb() {
+		var settings = new SettingServiceEnvironment();
+		var webServer = new WebServer(settings, new DataService(new RestClient(settings)));
+		try {
+			webServer.start(true);
+		} catch (Exception e) {
+			LOG.error("Error in Web server", e);
 		}
+	}
+
+	private static void runRest(String[] args) {
+		var module = new AbstractModule() {
+			@SuppressWarnings("unchecked")
+			@Override
+			protected void configure() {
+				for (var bnd : Constant.BINDS) {
+					if (bnd.singleton()) {
+						bind(bnd.classInterface()).to(bnd.classImplementation()).in(Singleton.class);
+					} else {
+						bind(bnd.classInterface()).to(bnd.classImplementation());
+					}
+				}
+			}
+		};
+		Constant.setInjector(Guice.createInjector(module));
+
+		var app = Constant.getInstance(App.class);
 
+		app.run(args);
 	}
 
 	private void run(String[] args) {
@@ -15,7 +15,9 @@
  */
 package com.maxrunsoftware.jezel;
 
+import java.util.Collections;
 import java.util.List;
+import java.util.Map;
 
 import com.google.inject.Injector;
 import com.maxrunsoftware.jezel.action.Command;
@@ -112,6 +114,15 @@ public class Constant {
 
 	);
 
+	public static final Map<String, Class<? extends Command>> COMMANDS_BY_NAME;
+	static {
+		Map<String, Class<? extends Command>> map = Util.mapCaseInsensitive();
+		for (var command : COMMANDS) {
+			map.put(command.getSimpleName(), command);
+		}
+		COMMANDS_BY_NAME = Collections.unmodifiableMap(map);
+	}
+
 	private static Injector injector;
 
 	public static void setInjector(Injector injector) {
@@ -18,6 +18,7 @@ package com.maxrunsoftware.jezel;
 import static com.maxrunsoftware.jezel.Util.*;
 
 import java.time.LocalDateTime;
+import java.util.List;
 
 import org.hibernate.Session;
 
@@ -27,52 +28,60 @@ import com.maxrunsoftware.jezel.model.SchedulerJob;
 import com.maxrunsoftware.jezel.model.SchedulerSchedule;
 
 public class RandomData {
+	private static final List<String> GROUPS = List.of("group1", "group2", "group3");
+
 	public static void populateDb(Session session) {
-		for (int i = 0; i < randomInt(8, 10); i++) {
+		var tx = session.beginTransaction();
+		var now = LocalDateTime.now();
+		var jobCount = randomInt(8, 10);
+		for (int i = 0; i < jobCount; i++) {
 			var j = new SchedulerJob();
 			j.setName(randomPick(Constant.NOUNS));
-			j.setGroup(randomPick("group1", "group2", "group3"));
+			j.setGroup(randomPick(GROUPS));
 			j.setDisabled(randomBoolean());
-			j = getById(SchedulerJob.class, session, save(session, j));
+			session.save(j);
 
-			for (int ii = 0; ii < randomInt(3, 5); ii++) {
+			var scheduleCount = randomInt(3, 5);
+			for (int ii = 0; ii < scheduleCount; ii++) {
 				var s = new SchedulerSchedule();
-				s.setDays(true, randomBoolean(), randomBoolean(), randomBoolean(), randomBoolean(), randomBoolean(), randomBoolean());
+				s.setDays(SchedulerSchedule.DAY_SUNDAY | (randomInt(0, 63) << 1));
 				s.setTime(randomInt(0, 23), randomInt(0, 59));
 				s.setDisabled(randomBoolean());
 				s.setSchedulerJob(j);
-				save(session, s);
+				session.save(s);
 			}
 			for (int ii = 0; ii < 3; ii++) {
 				var s = new SchedulerSchedule();
-				s.setDays(true, true, true, true, true, true, true);
-				s.setTime(LocalDateTime.now().getHour(), LocalDateTime.now().getMinute() + ii);
+				s.setDays(SchedulerSchedule.DAY_ALL);
+				s.setTime(now.getHour(), now.getMinute() + ii);
 				s.setDisabled(false);
 				s.setSchedulerJob(j);
-				save(session, s);
+				session.save(s);
 			}
 
-			for (int ii = 0; ii < randomInt(3, 5); ii++) {
+			var actionCount = randomInt(3, 5);
+			for (int ii = 0; ii < actionCount; ii++) {
 				var a = new SchedulerAction();
 				a.setName("SqlQuery");
 				a.setDescription(randomPick(Constant.NOUNS));
 				a.setDisabled(randomBoolean());
 				a.setSchedulerJob(j);
 				a.setIndex(ii);
-				a = getById(SchedulerAction.class, session, save(session, a));
+				session.save(a);
 
-				for (int iii = 0; iii < randomInt(5, 8); iii++) {
+				var parameterCount = randomInt(5, 8);
+				for (int iii = 0; iii < parameterCount; iii++) {
 					var ap = new SchedulerActionParameter();
 					ap.setName(randomPick(Constant.NOUNS));
 					ap.setValue(randomPick(Constant.NOUNS));
 					ap.setSchedulerAction(a);
-					save(session, a);
+					session.save(ap);
 				}
 
 			}
 
 		}
-
+		tx.commit();
 	}
 
 	public static void populateDb(DatabaseService db) {
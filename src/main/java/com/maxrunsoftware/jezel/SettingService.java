@@ -93,6 +93,26 @@ public interface SettingService {
 		return getEnvironmentVariable("JEZEL_DatabaseShowSql", false);
 	}
 
+	public default int getDatabasePoolMinSize() {
+		return getEnvironmentVariable("JEZEL_DatabasePoolMinSize", 1);
+	}
+
+	public default int getDatabasePoolMaxSize() {
+		return getEnvironmentVariable("JEZEL_DatabasePoolMaxSize", 10);
+	}
+
+	public default int getDatabasePoolCheckoutTimeout() {
+		return getEnvironmentVariable("JEZEL_DatabasePoolCheckoutTimeout", 30000);
+	}
+
+	public default int getDatabasePoolMaxConnectionAge() {
+		return getEnvironmentVariable("JEZEL_DatabasePoolMaxConnectionAge", 1800);
+	}
+
+	public default boolean getDatabasePoolTestOnCheckout() {
+		return getEnvironmentVariable("JEZEL_DatabasePoolTestOnCheckout", true);
+	}
+
 	public default int getWebPort() {
 		return getEnvironmentVariable("JEZEL_WebPort", getRestPort() + 1);
 	}
@@ -113,6 +133,10 @@ public interface SettingService {
 		return getEnvironmentVariable("JEZEL_WebJoinThread", true);
 	}
 
+	public default boolean getWebPrettyHtml() {
+		return getEnvironmentVariable("JEZEL_WebPrettyHtml", false);
+	}
+
 	public default String getWebUsername() {
 		return getEnvironmentVariable("JEZEL_WebUsername", getRestUsername());
 	}
@@ -124,11 +148,12 @@ public interface SettingService {
 	public default Map<String, Object> toMap() {
 		var map = new CaseInsensitiveMap<String, Object>();
 
-		for (var method : getClass().getDeclaredMethods()) {
+		for (var method : SettingService.class.getDeclaredMethods()) {
 			var methodName = method.getName();
 			if (!methodName.startsWith("get")) continue;
+			if (method.getParameterCount() != 0) continue;
 			int modifiers = method.getModifiers();
-			if (!Modifier.isPublic(modifiers)) continue;
+			if (!Modifier.isPublic(modifiers) || Modifier.isStatic(modifiers)) continue;
 			Object o;
 			try {
 				o = method.invoke(this);
@@ -136,7 +161,9 @@ public interface SettingService {
 				throw new Error(e);
 			}
 
-			map.put(methodName.substring("get".length()), o);
+			var name = methodName.substring("get".length());
+			if (o != null && name.endsWith("Password")) o = "********";
+			map.put(name, o);
 
 		}
 		return map;
@@ -23,17 +23,20 @@ import java.io.StringWriter;
 import java.io.Writer;
 import java.nio.charset.StandardCharsets;
 import java.util.Base64;
-import java.util.HashMap;
 import java.util.List;
 import java.util.Map;
 import java.util.UUID;
+import java.util.concurrent.ConcurrentHashMap;
 import java.util.concurrent.ThreadLocalRandom;
 import java.util.regex.Pattern;
+import java.util.stream.Stream;
 
 import javax.json.Json;
 import javax.json.JsonArrayBuilder;
+import javax.json.JsonBuilderFactory;
 import javax.json.JsonObject;
 import javax.json.JsonObjectBuilder;
+import javax.json.JsonReaderFactory;
 import javax.json.JsonWriterFactory;
 import javax.json.stream.JsonGenerator;
 import javax.persistence.criteria.CriteriaBuilder;
@@ -41,10 +44,25 @@ import javax.persistence.criteria.CriteriaQuery;
 
 import org.apache.commons.collections4.map.CaseInsensitiveMap;
 import org.hibernate.Session;
+import org.hibernate.query.Query;
 
 import jakarta.servlet.http.HttpServletRequest;
 
 public final class Util {
+	private static final JsonBuilderFactory JSON_BUILDER_FACTORY = Json.createBuilderFactory(null);
+	private static final JsonWriterFactory JSON_WRITER_FACTORY = Json.createWriterFactory(Map.of());
+	private static final JsonWriterFactory JSON_WRITER_FACTORY_FORMATTED = Json.createWriterFactory(Map.of(JsonGenerator.PRETTY_PRINTING, true));
+	private static final JsonReaderFactory JSON_READER_FACTORY = Json.createReaderFactory(Map.of());
+	private static final char[] HEX_DIGITS = "0123456789abcdef".toCharArray();
+	private static final String[] TWO_DIGITS = new String[100];
+	static {
+		for (int i = 0; i < TWO_DIGITS.length; i++) {
+			TWO_DIGITS[i] = i < 10 ? "0" + i : Integer.toString(i);
+		}
+	}
+	private static final Map<String, Pattern> SPLIT_PATTERNS = new ConcurrentHashMap<>();
+	private static final int STREAM_FETCH_SIZE = 500;
+
 	public static final String httpAuthorizationEncode(String username, String password) {
 		final var up = username + ":" + password;
 		final var encodedBytes = up.getBytes(StandardCharsets.UTF_8);
@@ -65,18 +83,19 @@ public final class Util {
 
 	public static final HttpAuthorizationCredential httpAuthorizationDecode(String authorization) {
 		if (authorization == null) return null;
-		if (!authorization.toLowerCase().startsWith("basic")) return null;
+		if (!authorization.regionMatches(true, 0, "basic", 0, "basic".length())) return null;
 
 		final var base64Credentials = authorization.substring("basic".length()).trim();
 		final var credDecoded = Base64.getDecoder().decode(base64Credentials);
 		final var credentials = new String(credDecoded, StandardCharsets.UTF_8);
-		final var values = credentials.split(":", 2);
-		return new HttpAuthorizationCredential(values[0], values[1]);
+		final var separator = credentials.indexOf(':');
+		if (separator < 0) return null;
+		return new HttpAuthorizationCredential(credentials.substring(0, separator), credentials.substring(separator + 1));
 	}
 
 	public static final String httpAuthorizationDecodeBearer(String authorization) {
 		if (authorization == null) return null;
-		if (!authorization.toLowerCase().startsWith("bearer")) return null;
+		if (!authorization.regionMatches(true, 0, "bearer", 0, "bearer".length())) return null;
 
 		final var bearerToken = authorization.substring("bearer".length()).trim();
 		return bearerToken;
@@ -99,11 +118,7 @@ public final class Util {
 
 	protected static UUID asUUID(String val) {
 		if (val == null) return null;
-		if (val.length() == 32) val = val.subSequence(0, 8)
-				+ "-" + val.subSequence(8, 12)
-				+ "-" + val.subSequence(12, 16)
-				+ "-" + val.subSequence(16, 20)
-				+ "-" + val.subSequence(20, 32);
+		if (val.length() == 32) return new UUID(Long.parseUnsignedLong(val, 0, 16, 16), Long.parseUnsignedLong(val, 16, 32, 16));
 		if (val.length() != 36) return null;
 		return UUID.fromString(val);
 	}
@@ -115,17 +130,29 @@ public final class Util {
 		return s;
 	}
 
+	public static final String trimOrEmpty(String s) {
+		if (s == null) return "";
+		return s.trim();
+	}
+
 	public static final String trimOrNullLower(String s) {
 		s = trimOrNull(s);
 		if (s != null) s = s.toLowerCase();
 		return s;
 	}
 
+	public static final String padTwoDigits(int value) {
+		if (value >= 0 && value < TWO_DIGITS.length) return TWO_DIGITS[value];
+		return Integer.toString(value);
+	}
+
 	public static final boolean parseBoolean(String s) {
 		s = s.toLowerCase();
-		if (s.equals("true") || s.equals("t") || s.equals("yes") || s.equals("y") || s.equals("1") || s.equals("on")) return true;
-		if (s.equals("false") || s.equals("f") || s.equals("no") || s.equals("n") || s.equals("0") || s.equals("off")) return false;
-		throw new IllegalArgumentException("Could not parse '" + s + "' to boolean");
+		return switch (s) {
+			case "true", "t", "yes", "y", "1", "on" -> true;
+			case "false", "f", "no", "n", "0", "off" -> false;
+			default -> throw new IllegalArgumentException("Could not parse '" + s + "' to boolean");
+		};
 	}
 
 	public static final int parseInt(String s) {
@@ -138,8 +165,7 @@ public final class Util {
 	}
 
 	public static final String[] split(String s, String separator) {
-		// https://stackoverflow.com/a/6374137
-		return s.split(Pattern.quote(separator));
+		return SPLIT_PATTERNS.computeIfAbsent(separator, sep -> Pattern.compile(sep, Pattern.LITERAL)).split(s);
 	}
 
 	@SafeVarargs
@@ -152,35 +178,21 @@ public final class Util {
 
 	@SafeVarargs
 	public static final <T> boolean equalsAny(T sourceObj, T... otherObjs) {
-		//@formatter:off
 		if (otherObjs == null || otherObjs.length == 0) return false;
 		for (T otherObj : otherObjs) {
-			if (sourceObj == null) {
-				if (otherObj == null) return true;
-			} else {
-				if (otherObj != null) {
-					if (sourceObj.equals(otherObj)) return true; 
-				}
-			}
+			if (sourceObj == otherObj) return true;
+			if (sourceObj != null && otherObj != null && sourceObj.equals(otherObj)) return true;
 		}
-		//@formatter:on
 		return false;
 	}
 
 	@SafeVarargs
 	public static final boolean equalsAnyIgnoreCase(String sourceObj, String... otherObjs) {
-		//@formatter:off
 		if (otherObjs == null || otherObjs.length == 0) return false;
 		for (String otherObj : otherObjs) {
-			if (sourceObj == null) {
-				if (otherObj == null) return true;
-			} else {
-				if (otherObj != null) {
-					if (sourceObj.equalsIgnoreCase(otherObj)) return true; 
-				}
-			}
+			if (sourceObj == otherObj) return true;
+			if (sourceObj != null && sourceObj.equalsIgnoreCase(otherObj)) return true;
 		}
-		//@formatter:on
 		return false;
 	}
 
@@ -220,13 +232,27 @@ public final class Util {
 	}
 
 	public static boolean randomBoolean() {
-		return randomInt(0, 2) == 1 ? true : false;
+		return ThreadLocalRandom.current().nextBoolean();
 	}
 
 	public static UUID randomUUID() {
 		return UUID.randomUUID();
 	}
 
+	public static final String asHex(UUID uuid) {
+		var chars = new char[32];
+		asHex(uuid.getMostSignificantBits(), chars, 0);
+		asHex(uuid.getLeastSignificantBits(), chars, 16);
+		return new String(chars);
+	}
+
+	private static void asHex(long bits, char[] chars, int offset) {
+		for (int i = offset + 15; i >= offset; i--) {
+			chars[i] = HEX_DIGITS[(int) (bits & 0xF)];
+			bits >>>= 4;
+		}
+	}
+
 	@SafeVarargs
 	public static <T> T randomPick(T... objs) {
 		return objs[randomInt(0, objs.length - 1)];
@@ -237,7 +263,13 @@ public final class Util {
 	}
 
 	public static <T> T randomRemove(List<T> objs) {
-		return objs.remove(randomInt(0, objs.size() - 1));
+		// swap the pick with the last element so removal does not shift the list
+		var last = objs.size() - 1;
+		var index = randomInt(0, last);
+		var obj = objs.get(index);
+		objs.set(index, objs.get(last));
+		objs.remove(last);
+		return obj;
 	}
 
 	public static <V> Map<String, V> mapCaseInsensitive() {
@@ -252,20 +284,48 @@ public final class Util {
 		return data;
 	}
 
+	public static final <T> List<T> getAllReadOnly(Class<T> type, Session session) {
+		CriteriaBuilder builder = session.getCriteriaBuilder();
+		CriteriaQuery<T> criteria = builder.createQuery(type);
+		criteria.from(type);
+		List<T> data = session.createQuery(criteria).setReadOnly(true).getResultList();
+		return data;
+	}
+
+	public static final <T> List<T> getAllWhere(Class<T> type, Session session, String attribute, Object value) {
+		return createWhereQuery(type, session, attribute, value).getResultList();
+	}
+
+	public static final <T> List<T> getAllWhereReadOnly(Class<T> type, Session session, String attribute, Object value) {
+		return createWhereQuery(type, session, attribute, value).setReadOnly(true).getResultList();
+	}
+
+	private static <T> Query<T> createWhereQuery(Class<T> type, Session session, String attribute, Object value) {
+		// constant HQL text with a bound parameter so Hibernate reuses the cached query plan
+		return session.createQuery("from " + type.getSimpleName() + " where " + attribute + " = :value", type).setParameter("value", value);
+	}
+
+	public static final <T> Stream<T> streamAll(Class<T> type, Session session) {
+		CriteriaBuilder builder = session.getCriteriaBuilder();
+		CriteriaQuery<T> criteria = builder.createQuery(type);
+		criteria.from(type);
+		return session.createQuery(criteria).setReadOnly(true).setFetchSize(STREAM_FETCH_SIZE).stream();
+	}
+
 	public static final <T> T getById(Class<T> type, Session session, int id) {
 		return session.get(type, id);
 	}
 
 	public static final JsonObjectBuilder createObjectBuilder() {
-		return Json.createObjectBuilder();
+		return JSON_BUILDER_FACTORY.createObjectBuilder();
 	}
 
 	public static final JsonArrayBuilder createArrayBuilder() {
-		return Json.createArrayBuilder();
+		return JSON_BUILDER_FACTORY.createArrayBuilder();
 	}
 
 	public static final <T extends JsonCodable> JsonArrayBuilder createArrayBuilder(Iterable<T> iterable) {
-		var jb = Json.createArrayBuilder();
+		var jb = createArrayBuilder();
 		for (var item : iterable) {
 			jb.add(item.toJson());
 		}
@@ -290,11 +350,7 @@ public final class Util {
 	}
 
 	public static final String toJsonString(JsonObject jsonObject, boolean formatted) {
-		Map<String, Boolean> config = new HashMap<>();
-
-		if (formatted) { config.put(JsonGenerator.PRETTY_PRINTING, true); }
-
-		JsonWriterFactory writerFactory = Json.createWriterFactory(config);
+		var writerFactory = formatted ? JSON_WRITER_FACTORY_FORMATTED : JSON_WRITER_FACTORY;
 
 		String jsonString = "";
 		try (Writer writer = new StringWriter()) {
@@ -307,8 +363,15 @@ public final class Util {
 		return jsonString;
 	}
 
+	public static final void writeJson(JsonObject jsonObject, Writer writer, boolean formatted) {
+		var writerFactory = formatted ? JSON_WRITER_FACTORY_FORMATTED : JSON_WRITER_FACTORY;
+		writerFactory.createWriter(writer).write(jsonObject);
+	}
+
 	public static final JsonObject fromJsonString(String json) {
-		return Json.createReader(new StringReader(json)).readObject();
+		try (var reader = JSON_READER_FACTORY.createReader(new StringReader(json))) {
+			return reader.readObject();
+		}
 	}
 
 	public static final int save(Session session, Object obj) {
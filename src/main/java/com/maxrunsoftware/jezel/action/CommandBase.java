@@ -30,18 +30,17 @@ public abstract class CommandBase implements Command {
 	@Override
 	public void setParameters(Map<String, String> parameters) {
 		this.parameters.clear();
-		var sb = new StringBuilder();
-		sb.append("Setting parameters on Command to {");
+		var debug = LOG.isDebugEnabled();
+		var sb = debug ? new StringBuilder("Setting parameters on Command to {") : null;
 
-		for (var key : parameters.keySet()) {
-			var val = parameters.get(key);
-			if (val != null) {
-				sb.append("  " + key + ": " + val);
-				this.parameters.put(key, val);
-			}
+		for (var entry : parameters.entrySet()) {
+			var val = entry.getValue();
+			if (val == null) continue;
+			this.parameters.put(entry.getKey(), val);
+			if (debug) sb.append("  ").append(entry.getKey()).append(": ").append(val);
 		}
-		sb.append("}");
-		LOG.debug(sb.toString());
+
+		if (debug) LOG.debug(sb.append("}").toString());
 	}
 
 	@Override
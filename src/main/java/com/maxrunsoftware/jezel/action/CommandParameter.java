@@ -18,12 +18,16 @@ package com.maxrunsoftware.jezel.action;
 import static com.maxrunsoftware.jezel.Util.*;
 
 import java.util.ArrayList;
+import java.util.Collections;
 import java.util.HashMap;
 import java.util.HashSet;
 import java.util.List;
+import java.util.Map;
+import java.util.Set;
 
 import javax.json.JsonObject;
 
+import org.apache.commons.collections4.map.CaseInsensitiveMap;
 import org.hibernate.Session;
 
 import com.maxrunsoftware.jezel.Constant;
@@ -42,6 +46,7 @@ public class CommandParameter implements JsonCodable {
 	public static final String TYPE_BOOL = "boolean";
 	public static final String TYPE_FILENAME = "filename";
 	public static final String TYPE_OPTION = "option";
+	private static final Set<String> TYPES = Set.of(TYPE_STRING, TYPE_TEXT, TYPE_INT, TYPE_BOOL, TYPE_FILENAME, TYPE_OPTION);
 
 	public CommandParameter() {}
 
@@ -97,7 +102,7 @@ public class CommandParameter implements JsonCodable {
 			this.type = type;
 		} else {
 			type = type.toLowerCase();
-			if (equalsAny(type, TYPE_STRING, TYPE_TEXT, TYPE_INT, TYPE_BOOL, TYPE_FILENAME, TYPE_OPTION)) {
+			if (TYPES.contains(type)) {
 				this.type = type;
 			} else {
 				throw new IllegalArgumentException("Invalid type: " + type);
@@ -195,12 +200,12 @@ public class CommandParameter implements JsonCodable {
 	@Override
 	public JsonObject toJson() {
 		var json = createObjectBuilder();
-		json.add("name", coalesce(getName(), ""));
-		json.add("description", coalesce(getDescription(), ""));
-		json.add("type", coalesce(getType(), ""));
+		json.add("name", trimOrEmpty(name));
+		json.add("description", trimOrEmpty(description));
+		json.add("type", trimOrEmpty(type));
 		json.add("minValue", getMinValue() == null ? "" : getMinValue().toString());
 		json.add("maxValue", getMaxValue() == null ? "" : getMaxValue().toString());
-		json.add("defaultValue", coalesce(getDefaultValue(), ""));
+		json.add("defaultValue", trimOrEmpty(defaultValue));
 
 		var ab = createArrayBuilder();
 		for (var optionValue : getOptionValues()) {
@@ -232,7 +237,25 @@ public class CommandParameter implements JsonCodable {
 		this.setOptionValues(ovs);
 	}
 
+	private static final class Cache {
+		private static final List<CommandParameter> ALL = Collections.unmodifiableList(createAll());
+		private static final Map<String, CommandParameter> BY_NAME_FULL = new CaseInsensitiveMap<String, CommandParameter>();
+		private static final Map<String, List<CommandParameter>> BY_COMMAND = new CaseInsensitiveMap<String, List<CommandParameter>>();
+
+		static {
+			for (var cp : ALL) {
+				BY_NAME_FULL.putIfAbsent(cp.getNameFull(), cp);
+				BY_COMMAND.computeIfAbsent(cp.getClazz(), k -> new ArrayList<CommandParameter>()).add(cp);
+			}
+			BY_COMMAND.replaceAll((k, v) -> Collections.unmodifiableList(v));
+		}
+	}
+
 	public static List<CommandParameter> getAll() {
+		return Cache.ALL;
+	}
+
+	private static List<CommandParameter> createAll() {
 		var list = new ArrayList<CommandParameter>();
 		for (var c : Constant.COMMANDS) {
 			try {
@@ -246,29 +269,20 @@ public class CommandParameter implements JsonCodable {
 	}
 
 	public static List<CommandParameter> getForCommand(String commandName) {
-		var list = new ArrayList<CommandParameter>();
 		commandName = trimOrNull(commandName);
-		if (commandName == null) return list;
-		for (var cp : getAll()) {
-			if (cp.getClazz().equalsIgnoreCase(commandName)) { list.add(cp); }
-		}
-
-		return list;
+		if (commandName == null) return List.of();
+		var list = Cache.BY_COMMAND.get(commandName);
+		return list == null ? List.of() : list;
 	}
 
 	public static CommandParameter get(String nameFull) {
-		for (var cp : getAll()) {
-			if (cp.getNameFull().equalsIgnoreCase(nameFull)) return cp;
-		}
-		return null;
+		if (nameFull == null) return null;
+		return Cache.BY_NAME_FULL.get(nameFull);
 	}
 
 	public static List<CommandParameter> getWithPrefix(String prefix) {
-		var list = new ArrayList<CommandParameter>();
-		for (var cp : getAll()) {
-			if (cp.getClazz().equalsIgnoreCase(prefix)) list.add(cp);
-		}
-		return list;
+		var list = Cache.BY_COMMAND.get(prefix);
+		return list == null ? List.of() : list;
 	}
 
 	public static void initializeConfigurationItems(Session session) {
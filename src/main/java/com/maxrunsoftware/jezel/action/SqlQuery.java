@@ -21,8 +21,7 @@ import java.sql.Connection;
 import java.sql.DriverManager;
 import java.util.List;
 
-import org.apache.commons.lang3.StringUtils;
-
+import com.maxrunsoftware.jezel.Util;
 import com.maxrunsoftware.jezel.util.Table;
 
 public class SqlQuery extends CommandBase {
@@ -49,7 +48,7 @@ public class SqlQuery extends CommandBase {
 		l.add(createString("ConnectionString", "The JDBC connection string"));
 		l.add(createText("SQL", "The SQL Statement(s) to execute"));
 		for (int i = 1; i <= 20; i++) {
-			var iString = StringUtils.right("00" + i, 2);
+			var iString = Util.padTwoDigits(i);
 			l.add(createFilename("OutputFile" + iString, "The tab-delimited output " + iString + " file"));
 		}
 
@@ -156,7 +156,7 @@ public class CommandLogAction implements JsonCodable {
 		json.add("start", getStart() == null ? "" : getStart().toString());
 		json.add("end", getEnd() == null ? "" : getEnd().toString());
 		json.add("index", getIndex());
-		json.add("name", coalesce(getName(), ""));
+		json.add("name", trimOrEmpty(name));
 		json.add(SchedulerAction.NAME, getSchedulerAction().toJson());
 		var arrayBuilder = createArrayBuilder();
 		for (var commandLogMessage : getCommandLogMessages()) {
@@ -51,6 +51,7 @@ public class CommandLogJob implements JsonCodable {
 			c = o1.getStart().compareTo(o2.getStart());
 			if (c != 0) return c;
 			c = o1.getEnd().compareTo(o2.getEnd());
+			if (c != 0) return c;
 			return compareTo(o1.getCommandLogJobId(), o2.getCommandLogJobId());
 		}
 	};
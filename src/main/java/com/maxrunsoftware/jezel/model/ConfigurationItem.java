@@ -18,6 +18,7 @@ package com.maxrunsoftware.jezel.model;
 import static com.maxrunsoftware.jezel.Util.*;
 
 import java.util.HashMap;
+import java.util.List;
 import java.util.Map;
 
 import javax.json.JsonObject;
@@ -78,8 +79,8 @@ public class ConfigurationItem implements JsonCodable {
 	public JsonObject toJson() {
 		var json = createObjectBuilder();
 		json.add(ID, getConfigurationItemId());
-		json.add("name", coalesce(getName(), ""));
-		json.add("value", coalesce(getValue(), ""));
+		json.add("name", trimOrEmpty(name));
+		json.add("value", trimOrEmpty(value));
 		return json.build();
 	}
 
@@ -105,14 +106,12 @@ public class ConfigurationItem implements JsonCodable {
 
 	public static Map<String, String> getValuesWithPrefix(Session session, String prefix) {
 		var map = new HashMap<String, String>();
-		prefix = prefix.toLowerCase();
 		if (!prefix.endsWith(".")) prefix += ".";
-		var cis = getValues(session);
-		for (var name : cis.keySet()) {
-			var value = cis.get(name);
-			if (name.toLowerCase().startsWith(prefix)) {
-				name = name.substring(prefix.length());
-				map.put(name, value);
+		var prefixLength = prefix.length();
+		for (var entry : getValues(session).entrySet()) {
+			var name = entry.getKey();
+			if (name.regionMatches(true, 0, prefix, 0, prefixLength)) {
+				map.put(name.substring(prefixLength), entry.getValue());
 			}
 
 		}
@@ -120,6 +119,17 @@ public class ConfigurationItem implements JsonCodable {
 
 	}
 
+	public static Map<String, Map<String, String>> getValuesByPrefix(Session session) {
+		Map<String, Map<String, String>> map = mapCaseInsensitive();
+		for (var entry : getValues(session).entrySet()) {
+			var name = entry.getKey();
+			var separator = name.indexOf('.');
+			if (separator < 0) continue;
+			map.computeIfAbsent(name.substring(0, separator), k -> new HashMap<String, String>()).put(name.substring(separator + 1), entry.getValue());
+		}
+		return map;
+	}
+
 	public static void setValue(Session session, String name, String value) {
 		name = trimOrNull(name);
 		if (name == null) return;
@@ -145,10 +155,8 @@ public class ConfigurationItem implements JsonCodable {
 	public static ConfigurationItem get(Session session, String name) {
 		name = trimOrNull(name);
 		if (name == null) return null;
-		for (var item : getAll(ConfigurationItem.class, session)) {
-			if (name.equalsIgnoreCase(item.getName())) { return item; }
-		}
-		return null;
+		var items = getByName(session, name);
+		return items.isEmpty() ? null : items.get(0);
 	}
 
 	public static boolean setValueExisting(Session session, String name, String value) {
@@ -168,11 +176,9 @@ public class ConfigurationItem implements JsonCodable {
 		name = trimOrNull(name);
 		if (name == null) return false;
 		boolean foundOne = false;
-		for (var item : getAll(ConfigurationItem.class, session)) {
-			if (name.equalsIgnoreCase(item.getName())) {
-				delete(session, item);
-				foundOne = true;
-			}
+		for (var item : getByName(session, name)) {
+			delete(session, item);
+			foundOne = true;
 		}
 		return foundOne;
 	}
@@ -180,10 +186,14 @@ public class ConfigurationItem implements JsonCodable {
 	public static String getValue(Session session, String name) {
 		name = trimOrNull(name);
 		if (name == null) return null;
-		for (var item : getAll(ConfigurationItem.class, session)) {
-			if (name.equalsIgnoreCase(item.getName())) return item.getValue();
-		}
-		return null;
+		var items = getByName(session, name);
+		return items.isEmpty() ? null : items.get(0).getValue();
+	}
+
+	private static List<ConfigurationItem> getByName(Session session, String name) {
+		return session.createQuery("from " + ConfigurationItem.class.getSimpleName() + " where lower(name) = :name", ConfigurationItem.class)
+				.setParameter("name", name.toLowerCase())
+				.getResultList();
 	}
 
 }
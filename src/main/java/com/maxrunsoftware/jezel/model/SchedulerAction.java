@@ -18,7 +18,9 @@ package com.maxrunsoftware.jezel.model;
 import static com.maxrunsoftware.jezel.Util.*;
 
 import java.util.ArrayList;
+import java.util.Collections;
 import java.util.Comparator;
+import java.util.HashMap;
 import java.util.HashSet;
 import java.util.List;
 import java.util.Set;
@@ -159,8 +161,8 @@ public class SchedulerAction implements JsonCodable {
 		var json = createObjectBuilder();
 		json.add(ID, getSchedulerActionId());
 		json.add(SchedulerJob.ID, getSchedulerJob().getSchedulerJobId());
-		json.add("name", coalesce(getName(), ""));
-		json.add("description", coalesce(getDescription(), ""));
+		json.add("name", trimOrEmpty(name));
+		json.add("description", trimOrEmpty(description));
 		json.add("disabled", isDisabled());
 		json.add("index", getIndex());
 		var arrayBuilder = createArrayBuilder();
@@ -196,28 +198,26 @@ public class SchedulerAction implements JsonCodable {
 	}
 
 	public static List<SchedulerAction> getBySchedulerJobId(Session session, int schedulerJobId) {
-		var list = new ArrayList<SchedulerAction>();
-		for (var o : Util.getAll(SchedulerAction.class, session)) {
-			if (Integer.valueOf(schedulerJobId).equals(o.getSchedulerJob().getSchedulerJobId())) list.add(o);
-		}
-		return list;
+		return Util.getAllWhere(SchedulerAction.class, session, SchedulerJob.NAME + "." + SchedulerJob.ID, schedulerJobId);
 	}
 
-	public static List<String> getSchedulerActionNames() {
-		var list = new ArrayList<String>();
+	private static final List<String> SCHEDULER_ACTION_NAMES;
+	static {
+		var list = new ArrayList<String>(Constant.COMMANDS.size());
 		for (var clazz : Constant.COMMANDS) {
 			list.add(clazz.getSimpleName());
 		}
-		return list;
+		SCHEDULER_ACTION_NAMES = Collections.unmodifiableList(list);
+	}
+
+	public static List<String> getSchedulerActionNames() {
+		return SCHEDULER_ACTION_NAMES;
 	}
 
 	public static boolean isValidSchedulerActionName(String name) {
 		name = trimOrNull(name);
 		if (name == null) return false;
-		for (var n : getSchedulerActionNames()) {
-			if (name.equalsIgnoreCase(n)) return true;
-		}
-		return false;
+		return Constant.COMMANDS_BY_NAME.containsKey(name);
 	}
 
 	public SchedulerActionParameter getSchedulerActionParameter(String name) {
@@ -228,39 +228,28 @@ public class SchedulerAction implements JsonCodable {
 	}
 
 	public void syncParametersToCommand(Session session) {
-		var namesPar = new HashSet<String>();
-		var namesCmd = new HashSet<String>();
-
-		var namesToRemove = new HashSet<String>();
-		var namesToAdd = new HashSet<String>();
-
+		var parameters = new HashMap<String, SchedulerActionParameter>();
 		for (var par : getSchedulerActionParameters()) {
-			namesPar.add(par.getName());
+			parameters.putIfAbsent(par.getName(), par);
 		}
 
+		var namesCmd = new HashSet<String>();
 		for (var cmd : CommandParameter.getForCommand(getName())) {
 			namesCmd.add(cmd.getName());
 		}
 
-		for (var namePar : namesPar) {
-			if (!namesCmd.contains(namePar)) { namesToRemove.add(namePar); }
+		for (var parameter : parameters.entrySet()) {
+			if (namesCmd.contains(parameter.getKey())) continue;
+			LOG.debug("Removing parameter [" + parameter.getKey() + "] from SchedulerAction[" + getSchedulerActionId() + "]");
+			delete(session, parameter.getValue());
 		}
 
 		for (var nameCmd : namesCmd) {
-			if (!namesPar.contains(nameCmd)) { namesToAdd.add(nameCmd); }
-		}
-
-		for (var nameToRemove : namesToRemove) {
-			LOG.debug("Removing parameter [" + nameToRemove + "] from SchedulerAction[" + getSchedulerActionId() + "]");
-			var p = getSchedulerActionParameter(nameToRemove);
-			delete(session, p);
-		}
-
-		for (var nameToAdd : namesToAdd) {
-			LOG.debug("Adding parameter [" + nameToAdd + "] to SchedulerAction[" + getSchedulerActionId() + "]");
+			if (parameters.containsKey(nameCmd)) continue;
+			LOG.debug("Adding parameter [" + nameCmd + "] to SchedulerAction[" + getSchedulerActionId() + "]");
 
 			var p = new SchedulerActionParameter();
-			p.setName(nameToAdd);
+			p.setName(nameCmd);
 			p.setSchedulerAction(this);
 			save(session, p);
 		}
@@ -47,7 +47,7 @@ public class SchedulerJob implements JsonCodable {
 			if (o1 == o2) return 0;
 			if (o1 == null) return -1;
 			if (o2 == null) return 1;
-			return Integer.valueOf(o1.getSchedulerJobId()).compareTo(o2.getSchedulerJobId());
+			return compareTo(o1.getSchedulerJobId(), o2.getSchedulerJobId());
 		}
 	};
 
@@ -57,7 +57,7 @@ public class SchedulerJob implements JsonCodable {
 			if (o1 == o2) return 0;
 			if (o1 == null) return -1;
 			if (o2 == null) return 1;
-			return coalesce(o1.getGroup(), "").toLowerCase().compareTo(coalesce(o2.getGroup(), "").toLowerCase());
+			return String.CASE_INSENSITIVE_ORDER.compare(coalesce(o1.getGroup(), ""), coalesce(o2.getGroup(), ""));
 		}
 	};
 
@@ -146,8 +146,8 @@ public class SchedulerJob implements JsonCodable {
 	public JsonObject toJson() {
 		var json = createObjectBuilder();
 		json.add(ID, getSchedulerJobId());
-		json.add("name", coalesce(getName(), ""));
-		json.add("group", coalesce(getGroup(), ""));
+		json.add("name", trimOrEmpty(name));
+		json.add("group", trimOrEmpty(group));
 		json.add("disabled", isDisabled());
 
 		var arrayBuilder = createArrayBuilder();
@@ -202,11 +202,11 @@ public class SchedulerJob implements JsonCodable {
 		var list = new ArrayList<SchedulerAction>(getSchedulerActions());
 		Collections.sort(list, SchedulerAction.SORT_INDEX);
 
+		var tx = session.beginTransaction();
 		for (int i = 0; i < list.size(); i++) {
-			var schedulerAction = list.get(i);
-			schedulerAction.setIndex(i);
-			save(session, schedulerAction);
+			list.get(i).setIndex(i);
 		}
+		tx.commit();
 	}
 
 }
@@ -36,13 +36,22 @@ public class SchedulerSchedule implements JsonCodable {
 	public static final String NAME = "schedulerSchedule";
 	public static final String ID = NAME + "Id";
 
+	public static final int DAY_SUNDAY = 1;
+	public static final int DAY_MONDAY = 1 << 1;
+	public static final int DAY_TUESDAY = 1 << 2;
+	public static final int DAY_WEDNESDAY = 1 << 3;
+	public static final int DAY_THURSDAY = 1 << 4;
+	public static final int DAY_FRIDAY = 1 << 5;
+	public static final int DAY_SATURDAY = 1 << 6;
+	public static final int DAY_ALL = (1 << 7) - 1;
+
 	public static final Comparator<SchedulerSchedule> SORT_ID = new Comparator<SchedulerSchedule>() {
 		@Override
 		public int compare(SchedulerSchedule o1, SchedulerSchedule o2) {
 			if (o1 == o2) return 0;
 			if (o1 == null) return -1;
 			if (o2 == null) return 1;
-			return Integer.valueOf(o1.getSchedulerScheduleId()).compareTo(o2.getSchedulerScheduleId());
+			return compareTo(o1.getSchedulerScheduleId(), o2.getSchedulerScheduleId());
 		}
 	};
 
@@ -155,9 +164,7 @@ public class SchedulerSchedule implements JsonCodable {
 	}
 
 	public void setHour(int hour) {
-		if (hour > 23) hour = 23;
-		if (hour < 0) hour = 0;
-		this.hour = hour;
+		this.hour = Math.max(0, Math.min(23, hour));
 	}
 
 	@Column(nullable = false)
@@ -168,9 +175,7 @@ public class SchedulerSchedule implements JsonCodable {
 	}
 
 	public void setMinute(int minute) {
-		if (minute > 59) minute = 59;
-		if (minute < 0) minute = 0;
-		this.minute = minute;
+		this.minute = Math.max(0, Math.min(59, minute));
 	}
 
 	@Column(nullable = false)
@@ -234,6 +239,28 @@ public class SchedulerSchedule implements JsonCodable {
 		setSaturday(saturday);
 	}
 
+	public void setDays(int days) {
+		setSunday((days & DAY_SUNDAY) != 0);
+		setMonday((days & DAY_MONDAY) != 0);
+		setTuesday((days & DAY_TUESDAY) != 0);
+		setWednesday((days & DAY_WEDNESDAY) != 0);
+		setThursday((days & DAY_THURSDAY) != 0);
+		setFriday((days & DAY_FRIDAY) != 0);
+		setSaturday((days & DAY_SATURDAY) != 0);
+	}
+
+	public int getDays() {
+		var days = 0;
+		if (sunday) days |= DAY_SUNDAY;
+		if (monday) days |= DAY_MONDAY;
+		if (tuesday) days |= DAY_TUESDAY;
+		if (wednesday) days |= DAY_WEDNESDAY;
+		if (thursday) days |= DAY_THURSDAY;
+		if (friday) days |= DAY_FRIDAY;
+		if (saturday) days |= DAY_SATURDAY;
+		return days;
+	}
+
 	public void setTime(int hour, int minute) {
 		setHour(hour);
 		setMinute(minute);
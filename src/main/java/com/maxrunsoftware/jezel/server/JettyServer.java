@@ -94,8 +94,9 @@ public class JettyServer {
 		server.setStopAtShutdown(true);
 		server.setStopTimeout(5000);
 
+		var secured = !credentials.isEmpty();
 		ServletContextHandler context;
-		if (credentials.size() > 0) {
+		if (secured) {
 			context = new ServletContextHandler(ServletContextHandler.SESSIONS | ServletContextHandler.SECURITY);
 		} else {
 			context = new ServletContextHandler(ServletContextHandler.SESSIONS);
@@ -119,7 +120,7 @@ public class JettyServer {
 		// server.setHandler(servletHandler);
 		// servletHandler.addServletWithMapping(Servlet.class, "/*");
 
-		if (credentials.size() > 0) {
+		if (secured) {
 
 			Constraint constraint = new Constraint();
 			constraint.setName(Constraint.__FORM_AUTH);
@@ -131,10 +132,10 @@ public class JettyServer {
 			constraintMapping.setPathSpec("/*");
 
 			var userStore = new UserStore();
-			for (var username : credentials.keySet()) {
-				var password = credentials.get(username);
-				userStore.addUser(username, new Password(password), new String[] { "user" });
-				LOG.debug("Adding credential [" + username + "]: " + password);
+			for (var credential : credentials.entrySet()) {
+				var username = credential.getKey();
+				userStore.addUser(username, new Password(credential.getValue()), new String[] { "user" });
+				LOG.debug("Adding credential [{}]", username);
 			}
 			var loginService = new HashLoginService();
 			loginService.setUserStore(userStore);
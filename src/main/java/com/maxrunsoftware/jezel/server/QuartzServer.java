@@ -17,7 +17,6 @@ package com.maxrunsoftware.jezel.server;
 
 import static com.google.common.base.Preconditions.*;
 import static com.maxrunsoftware.jezel.Util.*;
-import static org.apache.commons.lang3.StringUtils.*;
 
 import java.util.ArrayList;
 import java.util.Collections;
@@ -28,6 +27,7 @@ import java.util.Properties;
 import org.quartz.CronScheduleBuilder;
 import org.quartz.Job;
 import org.quartz.JobBuilder;
+import org.quartz.JobDataMap;
 import org.quartz.JobExecutionContext;
 import org.quartz.JobExecutionException;
 import org.quartz.JobKey;
@@ -41,20 +41,23 @@ import org.quartz.impl.matchers.GroupMatcher;
 import org.quartz.spi.JobFactory;
 import org.quartz.spi.TriggerFiredBundle;
 
+import com.maxrunsoftware.jezel.model.SchedulerJob;
 import com.maxrunsoftware.jezel.model.SchedulerSchedule;
 
 public class QuartzServer {
 	private static final org.slf4j.Logger LOG = org.slf4j.LoggerFactory.getLogger(QuartzServer.class);
+	private static final String DATA_SCHEDULER_SCHEDULE = SchedulerSchedule.NAME;
+	private static final String DATA_SCHEDULER_JOB_ID = SchedulerJob.ID;
 
 	private QuartzServerExecutor executor;
 	private Scheduler scheduler;
 
 	private static JobKey createJobKey(int schedulerJobId) {
-		return new JobKey("" + schedulerJobId);
+		return new JobKey(Integer.toString(schedulerJobId));
 	}
 
 	private static TriggerKey createTriggerKey(int schedulerScheduleId) {
-		return new TriggerKey("" + schedulerScheduleId);
+		return new TriggerKey(Integer.toString(schedulerScheduleId));
 	}
 
 	public Boolean existsJob(int jobId) {
@@ -110,36 +113,49 @@ public class QuartzServer {
 	}
 
 	public boolean addTrigger(int schedulerJobId, SchedulerSchedule schedulerSchedule) {
-		var daysList = new ArrayList<Integer>();
-		if (schedulerSchedule.isSunday()) daysList.add(1);
-		if (schedulerSchedule.isMonday()) daysList.add(2);
-		if (schedulerSchedule.isTuesday()) daysList.add(3);
-		if (schedulerSchedule.isWednesday()) daysList.add(4);
-		if (schedulerSchedule.isThursday()) daysList.add(5);
-		if (schedulerSchedule.isFriday()) daysList.add(6);
-		if (schedulerSchedule.isSaturday()) daysList.add(7);
-		var days = daysList.toArray(Integer[]::new);
-
-		var hour = schedulerSchedule.getHour();
-		if (hour > 23) hour = 23;
-		if (hour < 0) hour = 0;
-		var minute = schedulerSchedule.getMinute();
-		if (minute > 59) minute = 59;
-		if (minute < 0) minute = 0;
+		var mask = schedulerSchedule.getDays();
+		if (mask == 0) {
+			LOG.debug("SchedulerSchedule[" + schedulerSchedule.getSchedulerScheduleId() + "] has no days selected so not adding Trigger");
+			return true;
+		}
+
+		// Quartz numbers days of week from 1 (Sunday), matching the SchedulerSchedule bit order
+		var days = new Integer[Integer.bitCount(mask)];
+		for (int bit = 0, i = 0; bit < 7; bit++) {
+			if ((mask & (1 << bit)) != 0) days[i++] = bit + 1;
+		}
+
+		// the copy goes through the clamping setters, so its hour and minute are always in range
+		var scheduleCopy = copy(schedulerSchedule);
+		var hour = scheduleCopy.getHour();
+		var minute = scheduleCopy.getMinute();
 
 		var jobId = schedulerJobId;
 		var triggerId = schedulerSchedule.getSchedulerScheduleId();
 
+		var data = new JobDataMap();
+		data.put(DATA_SCHEDULER_JOB_ID, jobId);
+		data.put(DATA_SCHEDULER_SCHEDULE, scheduleCopy);
+
 		var trigger = TriggerBuilder.newTrigger()
 				.forJob(createJobKey(jobId))
 				.withIdentity(createTriggerKey(triggerId))
-				.withDescription(toJsonString(schedulerSchedule.toJson(), false))
+				.usingJobData(data)
 				.withSchedule(CronScheduleBuilder.atHourAndMinuteOnGivenDaysOfWeek(hour, minute, days))
 				.build();
 
 		return addTrigger(jobId, triggerId, trigger);
 	}
 
+	private static SchedulerSchedule copy(SchedulerSchedule schedulerSchedule) {
+		var o = new SchedulerSchedule();
+		o.setSchedulerScheduleId(schedulerSchedule.getSchedulerScheduleId());
+		o.setDays(schedulerSchedule.getDays());
+		o.setTime(schedulerSchedule.getHour(), schedulerSchedule.getMinute());
+		o.setDisabled(schedulerSchedule.isDisabled());
+		return o;
+	}
+
 	private boolean addTrigger(int jobId, int triggerId, Trigger trigger) {
 		var removeResult = removeTrigger(triggerId);
 		if (!removeResult) return false; // Should already be logged in removeTrigger
@@ -156,17 +172,18 @@ public class QuartzServer {
 	public static record QuartzEntry(int jobId, SchedulerSchedule schedulerSchedule) {
 		@Override
 		public String toString() {
-			var sb = new StringBuilder();
-			sb.append("SchedulerJob[" + jobId + "]:SchedulerSchedule[" + schedulerSchedule.getSchedulerScheduleId() + "] ");
-			sb.append("SUN=" + (schedulerSchedule.isSunday() ? "1" : "0") + "  ");
-			sb.append("MON=" + (schedulerSchedule.isMonday() ? "1" : "0") + "  ");
-			sb.append("TUE=" + (schedulerSchedule.isTuesday() ? "1" : "0") + "  ");
-			sb.append("WED=" + (schedulerSchedule.isWednesday() ? "1" : "0") + "  ");
-			sb.append("THU=" + (schedulerSchedule.isThursday() ? "1" : "0") + "  ");
-			sb.append("FRI=" + (schedulerSchedule.isFriday() ? "1" : "0") + "  ");
-			sb.append("SAT=" + (schedulerSchedule.isSaturday() ? "1" : "0") + "  ");
-			sb.append("HOUR=" + right("000" + schedulerSchedule.getHour(), 2) + "  ");
-			sb.append("MIN=" + right("000" + schedulerSchedule.getMinute(), 2));
+			var s = schedulerSchedule;
+			var sb = new StringBuilder(128);
+			sb.append("SchedulerJob[").append(jobId).append("]:SchedulerSchedule[").append(s.getSchedulerScheduleId()).append("] ");
+			sb.append("SUN=").append(s.isSunday() ? '1' : '0').append("  ");
+			sb.append("MON=").append(s.isMonday() ? '1' : '0').append("  ");
+			sb.append("TUE=").append(s.isTuesday() ? '1' : '0').append("  ");
+			sb.append("WED=").append(s.isWednesday() ? '1' : '0').append("  ");
+			sb.append("THU=").append(s.isThursday() ? '1' : '0').append("  ");
+			sb.append("FRI=").append(s.isFriday() ? '1' : '0').append("  ");
+			sb.append("SAT=").append(s.isSaturday() ? '1' : '0').append("  ");
+			sb.append("HOUR=").append(padTwoDigits(s.getHour())).append("  ");
+			sb.append("MIN=").append(padTwoDigits(s.getMinute()));
 			return sb.toString();
 		}
 
@@ -178,9 +195,9 @@ public class QuartzServer {
 			if (o1 == o2) return 0;
 			if (o1 == null) return -1;
 			if (o2 == null) return 1;
-			var r = Integer.valueOf(o1.jobId).compareTo(o2.jobId);
+			var r = compareTo(o1.jobId, o2.jobId);
 			if (r != 0) return r;
-			return Integer.valueOf(o1.schedulerSchedule.getSchedulerScheduleId()).compareTo(o2.schedulerSchedule.getSchedulerScheduleId());
+			return compareTo(o1.schedulerSchedule.getSchedulerScheduleId(), o2.schedulerSchedule.getSchedulerScheduleId());
 		}
 	};
 
@@ -190,10 +207,9 @@ public class QuartzServer {
 			var triggerKeys = scheduler.getTriggerKeys(GroupMatcher.anyGroup());
 			for (var triggerKey : triggerKeys) {
 				var trigger = scheduler.getTrigger(triggerKey);
-				var desc = trigger.getDescription();
-				var schedulerSchedule = new SchedulerSchedule();
-				schedulerSchedule.fromJson(fromJsonString(desc));
-				var entry = new QuartzEntry(parseInt(trigger.getJobKey().getName()), schedulerSchedule);
+				var data = trigger.getJobDataMap();
+				var schedulerSchedule = (SchedulerSchedule) data.get(DATA_SCHEDULER_SCHEDULE);
+				var entry = new QuartzEntry(data.getInt(DATA_SCHEDULER_JOB_ID), schedulerSchedule);
 				list.add(entry);
 			}
 		} catch (SchedulerException e) {
@@ -214,8 +230,9 @@ public class QuartzServer {
 
 		@Override
 		public void execute(JobExecutionContext context) throws JobExecutionException {
-			var jobId = Integer.parseInt(context.getJobDetail().getKey().getName());
-			var triggerId = Integer.parseInt(context.getTrigger().getKey().getName());
+			var data = context.getTrigger().getJobDataMap();
+			var jobId = data.getInt(DATA_SCHEDULER_JOB_ID);
+			var triggerId = ((SchedulerSchedule) data.get(DATA_SCHEDULER_SCHEDULE)).getSchedulerScheduleId();
 			var executor = server.getExecutor();
 			executor.execute(jobId, triggerId);
 		}
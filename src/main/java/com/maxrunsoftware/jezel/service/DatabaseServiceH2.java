@@ -40,8 +40,10 @@ public class DatabaseServiceH2 implements DatabaseService {
 
 		var directory = settings.getDatabaseDir();
 
+		var memory = directory == null || directory.equalsIgnoreCase("mem") || directory.equalsIgnoreCase("memory");
+
 		String cs;
-		if (directory == null || directory.equalsIgnoreCase("mem") || directory.equalsIgnoreCase("memory")) {
+		if (memory) {
 			cs = "jdbc:h2:mem:test";
 		} else {
 			// if (!directory.endsWith("/")) directory = directory + "/";
@@ -60,11 +62,19 @@ public class DatabaseServiceH2 implements DatabaseService {
 		configuration.setProperty("hibernate.connection.password", "");
 		configuration.setProperty("hibernate.dialect", H2Dialect.class.getName());
 
-		configuration.setProperty("connection.provider_class", "org.hibernate.connection.C3P0ConnectionProvider");
+		configuration.setProperty("hibernate.connection.provider_class", "org.hibernate.c3p0.internal.C3P0ConnectionProvider");
 		configuration.setProperty("hibernate.c3p0.acquire_increment", "1");
 		configuration.setProperty("hibernate.c3p0.idle_test_period", "60");
-		configuration.setProperty("hibernate.c3p0.min_size", "1");
-		configuration.setProperty("hibernate.c3p0.max_size", "2");
+		if (memory) {
+			configuration.setProperty("hibernate.c3p0.min_size", "1");
+			configuration.setProperty("hibernate.c3p0.max_size", "2");
+		} else {
+			configuration.setProperty("hibernate.c3p0.min_size", "" + settings.getDatabasePoolMinSize());
+			configuration.setProperty("hibernate.c3p0.max_size", "" + settings.getDatabasePoolMaxSize());
+			configuration.setProperty("hibernate.c3p0.checkoutTimeout", "" + settings.getDatabasePoolCheckoutTimeout());
+			configuration.setProperty("hibernate.c3p0.maxConnectionAge", "" + settings.getDatabasePoolMaxConnectionAge());
+			configuration.setProperty("hibernate.c3p0.testConnectionOnCheckout", "" + settings.getDatabasePoolTestOnCheckout());
+		}
 		configuration.setProperty("hibernate.c3p0.max_statements", "50");
 		configuration.setProperty("hibernate.c3p0.timeout", "0");
 		configuration.setProperty("hibernate.c3p0.acquireRetryAttempts", "1");
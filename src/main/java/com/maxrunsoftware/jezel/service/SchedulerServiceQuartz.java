@@ -18,6 +18,8 @@ package com.maxrunsoftware.jezel.service;
 import static com.google.common.base.Preconditions.*;
 import static com.maxrunsoftware.jezel.Util.*;
 
+import java.util.List;
+
 import javax.inject.Inject;
 
 import com.maxrunsoftware.jezel.DatabaseService;
@@ -43,14 +45,18 @@ public class SchedulerServiceQuartz implements SchedulerService {
 
 	@Override
 	public void syncAll() {
+		List<Integer> schedulerJobIds;
 		try (var session = db.openSession()) {
-			for (var job : getAll(SchedulerJob.class, session)) {
-				sync(job.getSchedulerJobId());
-			}
+			schedulerJobIds = session.createQuery("select " + SchedulerJob.ID + " from " + SchedulerJob.class.getSimpleName(), Integer.class).getResultList();
+		}
+		for (var schedulerJobId : schedulerJobIds) {
+			sync(schedulerJobId);
 		}
 
-		for (var entry : server.getEntries()) {
-			LOG.debug(entry.toString());
+		if (LOG.isDebugEnabled()) {
+			for (var entry : server.getEntries()) {
+				LOG.debug(entry.toString());
+			}
 		}
 	}
 
@@ -63,19 +69,21 @@ public class SchedulerServiceQuartz implements SchedulerService {
 			if (schedulerJob == null) {
 				LOG.debug("SchedulerJob[" + schedulerJobId + "] does not exist in database so removing from Scheduler");
 				jobRemove = true;
-			}
-			if (schedulerJob.isDisabled()) {
+			} else if (schedulerJob.isDisabled()) {
 				LOG.debug("SchedulerJob[" + schedulerJobId + "] is disabled so removing from Scheduler");
 				jobRemove = true;
-			}
-
-			var allSchedulesDisabled = true;
-			for (var schedulerSchedule : schedulerJob.getSchedulerSchedules()) {
-				if (!schedulerSchedule.isDisabled()) allSchedulesDisabled = false;
-			}
-			if (allSchedulesDisabled) {
-				LOG.debug("SchedulerJob[" + schedulerJobId + "] does not contain any schedules or all schedules are disabled so removing from Scheduler");
-				jobRemove = true;
+			} else {
+				var allSchedulesDisabled = true;
+				for (var schedulerSchedule : schedulerJob.getSchedulerSchedules()) {
+					if (!schedulerSchedule.isDisabled()) {
+						allSchedulesDisabled = false;
+						break;
+					}
+				}
+				if (allSchedulesDisabled) {
+					LOG.debug("SchedulerJob[" + schedulerJobId + "] does not contain any schedules or all schedules are disabled so removing from Scheduler");
+					jobRemove = true;
+				}
 			}
 
 			var jobExistsInScheduler = server.existsJob(schedulerJobId);
@@ -100,6 +108,7 @@ public class SchedulerServiceQuartz implements SchedulerService {
 				var result = server.addJob(schedulerJobId);
 				if (!result) return;
 				for (var schedulerSchedule : schedulerJob.getSchedulerSchedules()) {
+					if (schedulerSchedule.isDisabled()) continue;
 					LOG.debug("For SchedulerJob[" + schedulerJobId + "] adding SchedulerSchedule[" + schedulerSchedule.getSchedulerScheduleId() + "]");
 					result = server.addTrigger(schedulerJobId, schedulerSchedule);
 
@@ -21,9 +21,9 @@ import static com.maxrunsoftware.jezel.Util.*;
 import java.time.LocalDateTime;
 import java.util.ArrayList;
 import java.util.HashMap;
-import java.util.HashSet;
 import java.util.Map;
 import java.util.Set;
+import java.util.concurrent.ConcurrentHashMap;
 
 import javax.inject.Inject;
 
@@ -45,18 +45,14 @@ public class SchedulerServiceSchedulerJob {
 		private final String schedulerActionName;
 		private final Map<String, String> parameters;
 
-		public ActionItem(SchedulerAction schedulerAction, DatabaseService db) {
+		public ActionItem(SchedulerAction schedulerAction, Map<String, Map<String, String>> configuration) {
 			this.schedulerActionId = schedulerAction.getSchedulerActionId();
 			this.schedulerActionName = schedulerAction.getName();
 
 			parameters = new HashMap<String, String>();
 
-			try (var session = db.openSession()) {
-				var parametersDefault = ConfigurationItem.getValuesWithPrefix(session, schedulerActionName);
-				for (var key : parametersDefault.keySet()) {
-					parameters.put(key, parametersDefault.get(key));
-				}
-			}
+			var parametersDefault = configuration.get(schedulerActionName);
+			if (parametersDefault != null) parameters.putAll(parametersDefault);
 
 			for (var schedulerActionParameter : schedulerAction.getSchedulerActionParameters()) {
 				var key = schedulerActionParameter.getName();
@@ -128,15 +124,12 @@ public class SchedulerServiceSchedulerJob {
 		return successfulExection;
 	}
 
-	private static final Object locker = new Object();
-	private static final Set<Integer> executingJobs = new HashSet<Integer>();
+	private static final Set<Integer> executingJobs = ConcurrentHashMap.newKeySet();
 
 	public void execute(final int schedulerJobId) {
-		synchronized (locker) {
-			if (!executingJobs.add(schedulerJobId)) {
-				LOG.warn("SchedulerJob[" + schedulerJobId + "] already executing so skipping execution");
-				return;
-			}
+		if (!executingJobs.add(schedulerJobId)) {
+			LOG.warn("SchedulerJob[" + schedulerJobId + "] already executing so skipping execution");
+			return;
 		}
 		try {
 			int commandLogJobId;
@@ -161,8 +154,9 @@ public class SchedulerServiceSchedulerJob {
 				commandLogJob.setStart(LocalDateTime.now());
 				commandLogJobId = save(session, commandLogJob);
 
+				var configuration = ConfigurationItem.getValuesByPrefix(session);
 				for (var schedulerAction : schedulerJob.getSchedulerActions()) {
-					actions.add(new ActionItem(schedulerAction, db));
+					actions.add(new ActionItem(schedulerAction, configuration));
 				}
 			}
 
@@ -185,9 +179,7 @@ public class SchedulerServiceSchedulerJob {
 
 			LOG.info("Completed execution of SchedulerJob[" + schedulerJobId + "] " + schedulerJobName);
 		} finally {
-			synchronized (locker) {
-				executingJobs.remove(schedulerJobId);
-			}
+			executingJobs.remove(schedulerJobId);
 		}
 	}
 
@@ -195,13 +187,9 @@ public class SchedulerServiceSchedulerJob {
 		var name = trimOrNull(action.getSchedulerActionName());
 		if (name == null) return null;
 
-		for (var clazz : Constant.COMMANDS) {
-			if (name.equalsIgnoreCase(clazz.getSimpleName())) {
-				var command = Constant.getInstance(clazz);
-				return command;
-			}
-		}
-		return null;
+		var clazz = Constant.COMMANDS_BY_NAME.get(name);
+		if (clazz == null) return null;
+		return Constant.getInstance(clazz);
 
 	}
 
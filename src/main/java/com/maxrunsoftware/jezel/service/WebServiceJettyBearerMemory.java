@@ -15,11 +15,8 @@
  */
 package com.maxrunsoftware.jezel.service;
 
-import java.time.LocalDateTime;
-import java.time.temporal.ChronoUnit;
 import java.util.Map;
-
-import org.apache.commons.collections4.map.CaseInsensitiveMap;
+import java.util.concurrent.ConcurrentHashMap;
 
 import com.maxrunsoftware.jezel.BearerService;
 import com.maxrunsoftware.jezel.Util;
@@ -27,62 +24,55 @@ import com.maxrunsoftware.jezel.Util;
 public class WebServiceJettyBearerMemory implements BearerService {
 	private static final org.slf4j.Logger LOG = org.slf4j.LoggerFactory.getLogger(WebServiceJettyBearerMemory.class);
 
-	private final Map<String, LocalDateTime> map = new CaseInsensitiveMap<String, LocalDateTime>();
-	private final Object locker = new Object();
+	private final Map<String, Long> map = new ConcurrentHashMap<String, Long>();
+
+	private static String key(String bearer) {
+		bearer = Util.trimOrNull(bearer);
+		return bearer == null ? null : bearer.toLowerCase();
+	}
 
 	@Override
 	public void addBearer(String bearer) {
-		synchronized (locker) {
-			bearer = Util.trimOrNull(bearer);
-			if (bearer == null) return;
-			map.remove(bearer);
-			var now = LocalDateTime.now();
-			LOG.debug("Adding Bearer token " + bearer);
-			map.put(bearer, now);
-		}
+		bearer = key(bearer);
+		if (bearer == null) return;
+		LOG.debug("Adding Bearer token {}", bearer);
+		map.put(bearer, System.currentTimeMillis());
 	}
 
 	@Override
 	public boolean authBearer(String bearer) {
-		synchronized (locker) {
-			bearer = Util.trimOrNull(bearer);
-			if (bearer == null) {
-				LOG.debug("Bearer auth failed, NULL bearer token");
-				return false;
-			}
-			var dt = map.get(bearer);
-			if (dt == null) {
-				LOG.debug("Bearer auth failed for token " + bearer + " because token does not exist");
-				return false;
-			}
-			var now = LocalDateTime.now();
-			var distance = dt.until(now, ChronoUnit.MILLIS);
-			if (distance > sessionTime) {
-				map.remove(bearer);
-				LOG.debug("Bearer auth failed for token " + bearer + " because token is expired");
-				return false;
-			}
-
-			map.put(bearer, now); // renew session
-			LOG.debug("Bearer auth success for token " + bearer);
-			return true;
+		bearer = key(bearer);
+		if (bearer == null) {
+			LOG.debug("Bearer auth failed, NULL bearer token");
+			return false;
 		}
+		var lastUsed = map.get(bearer);
+		if (lastUsed == null) {
+			LOG.debug("Bearer auth failed for token {} because token does not exist", bearer);
+			return false;
+		}
+		var now = System.currentTimeMillis();
+		if (now - lastUsed > sessionTime) {
+			map.remove(bearer, lastUsed);
+			LOG.debug("Bearer auth failed for token {} because token is expired", bearer);
+			return false;
+		}
+
+		map.put(bearer, now); // renew session
+		LOG.debug("Bearer auth success for token {}", bearer);
+		return true;
 	}
 
-	private int sessionTime = 1000 * 60 * 5; // 5 minutes
+	private volatile int sessionTime = 1000 * 60 * 5; // 5 minutes
 
 	@Override
 	public int getSessionTime() {
-		synchronized (locker) {
-			return sessionTime;
-		}
+		return sessionTime;
 	}
 
 	@Override
 	public void setSessionTime(int milliseconds) {
 		if (milliseconds < 1) milliseconds = Integer.MAX_VALUE;
-		synchronized (locker) {
-			sessionTime = milliseconds;
-		}
+		sessionTime = milliseconds;
 	}
 }
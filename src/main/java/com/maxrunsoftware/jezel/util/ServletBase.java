@@ -19,6 +19,7 @@ import static com.maxrunsoftware.jezel.Util.*;
 
 import java.io.IOException;
 import java.util.Collections;
+import java.util.HashMap;
 import java.util.Map;
 
 import org.apache.commons.collections4.map.CaseInsensitiveMap;
@@ -33,6 +34,7 @@ import jakarta.servlet.http.HttpServletResponse;
 public abstract class ServletBase extends HttpServlet {
 	private static final long serialVersionUID = 2411514340765948727L;
 	private static final org.slf4j.Logger LOG = org.slf4j.LoggerFactory.getLogger(ServletBase.class);
+	private static final String PARAMETERS_ATTRIBUTE = ServletBase.class.getName() + ".parameters";
 	private Object locker = new Object();
 	private Map<String, Object> resources = null;
 
@@ -40,18 +42,18 @@ public abstract class ServletBase extends HttpServlet {
 	protected <T> T getResource(Class<T> clazz) {
 		synchronized (locker) {
 			if (resources == null) {
-				resources = new CaseInsensitiveMap<String, Object>();
+				resources = new HashMap<String, Object>();
 
 				var ctx = getServletContext();
 				for (var attrName : Collections.list(ctx.getAttributeNames())) {
 					var attrVal = ctx.getAttribute(attrName);
 					if (attrVal != null) {
-						LOG.trace("Found attribute [" + attrName + "]: " + attrVal.getClass().getName());
+						LOG.trace("Found attribute [{}]: {}", attrName, attrVal.getClass().getName());
 						resources.put(attrName, attrVal);
 					}
 				}
 			}
-			LOG.debug("Getting service " + clazz.getName());
+			LOG.debug("Getting service {}", clazz.getName());
 			var o = resources.get(clazz.getName());
 			if (o == null) throw new IllegalArgumentException("No service found named " + clazz.getName());
 			return (T) o;
@@ -139,25 +141,30 @@ public abstract class ServletBase extends HttpServlet {
 	protected static String getParameter(HttpServletRequest request, String name) {
 		name = trimOrNull(name);
 		if (name == null) return null;
-		name = name.toLowerCase();
 
-		for (var pName : Collections.list(request.getParameterNames())) {
-			if (pName.toLowerCase().equals(name)) {
-				var val = request.getParameter(pName);
-				LOG.debug("Found header parameter [" + pName + "]: " + val);
-				return request.getParameter(pName);
+		var val = getParameters(request).get(name);
+		if (val != null) LOG.debug("Found header parameter [{}]: {}", name, val);
+		return val;
+	}
+
+	@SuppressWarnings("unchecked")
+	private static Map<String, String> getParameters(HttpServletRequest request) {
+		var parameters = (Map<String, String>) request.getAttribute(PARAMETERS_ATTRIBUTE);
+		if (parameters == null) {
+			parameters = new CaseInsensitiveMap<String, String>();
+			for (var entry : request.getParameterMap().entrySet()) {
+				var values = entry.getValue();
+				if (values == null || values.length == 0) continue;
+				parameters.putIfAbsent(entry.getKey(), values[0]);
 			}
+			request.setAttribute(PARAMETERS_ATTRIBUTE, parameters);
 		}
-		return null;
+		return parameters;
 	}
 
 	protected static void writeResponse(HttpServletResponse response, String content, int statusCode, String contentType) {
-		LOG.trace("Writing response [" + statusCode + "]: " + content);
-		response.setContentType(contentType);
-		response.setCharacterEncoding(Constant.ENCODING_UTF8);
-		response.setStatus(statusCode);
-		response.addHeader("Cache-Control", "no-cache");
-		response.addHeader("Content-Language", "en-US");
+		LOG.trace("Writing response [{}]: {}", statusCode, content);
+		prepareResponse(response, statusCode, contentType);
 		try {
 			response.getWriter().print(content);
 		} catch (IOException ioe) {
@@ -165,4 +172,12 @@ public abstract class ServletBase extends HttpServlet {
 		}
 	}
 
+	protected static void prepareResponse(HttpServletResponse response, int statusCode, String contentType) {
+		response.setContentType(contentType);
+		response.setCharacterEncoding(Constant.ENCODING_UTF8);
+		response.setStatus(statusCode);
+		response.addHeader("Cache-Control", "no-cache");
+		response.addHeader("Content-Language", "en-US");
+	}
+
 }
@@ -45,26 +45,19 @@ public class Table {
 			maxRowLength = Math.max(maxRowLength, row.size());
 		}
 
-		var newColumns = new ArrayList<String>();
-		for (int i = 0; i < maxRowLength; i++) {
-			if (i < columns.size()) {
-				newColumns.add(columns.get(i));
-			} else {
-				newColumns.add("Column" + (i + 1));
-			}
+		var newColumns = new ArrayList<String>(maxRowLength);
+		newColumns.addAll(columns);
+		for (int i = columns.size(); i < maxRowLength; i++) {
+			newColumns.add("Column" + (i + 1));
 		}
 		this.columns = Collections.unmodifiableList(newColumns);
 
-		var newRows = new ArrayList<List<String>>();
+		var newRows = new ArrayList<List<String>>(rows.size());
 		for (var row : rows) {
-			var newRow = new ArrayList<String>();
-			for (int i = 0; i < maxRowLength; i++) {
-				if (i < row.size()) {
-					newRow.add(row.get(i));
-				} else {
-					String s = null;
-					newRow.add(s);
-				}
+			var newRow = new ArrayList<String>(maxRowLength);
+			newRow.addAll(row);
+			while (newRow.size() < maxRowLength) {
+				newRow.add(null);
 			}
 			newRows.add(Collections.unmodifiableList(newRow));
 		}
@@ -136,7 +129,7 @@ public class Table {
 	}
 
 	public String toHtml() {
-		return toHtml(new HtmlFormatter());
+		return toHtml(HtmlFormatter.DEFAULT);
 	}
 
 	public String toHtml(HtmlFormatter formatter) {
@@ -170,12 +163,18 @@ public class Table {
 	}
 
 	public static class HtmlFormatter {
+		public static final HtmlFormatter DEFAULT = new HtmlFormatter();
+
 		public void th(StringBuilder sb, int columnIndex, String columnName) {
-			sb.append("<th>" + coalesce(columnName, "") + "</th>");
+			sb.append("<th>");
+			if (columnName != null) sb.append(columnName);
+			sb.append("</th>");
 		}
 
 		public void td(StringBuilder sb, int rowIndex, int columnIndex, String content) {
-			sb.append("<td>" + coalesce(content, "") + "</td>");
+			sb.append("<td>");
+			if (content != null) sb.append(content);
+			sb.append("</td>");
 		}
 
 		public void colgroup(StringBuilder sb, List<String> columns) {
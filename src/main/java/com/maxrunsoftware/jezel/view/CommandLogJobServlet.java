@@ -18,7 +18,6 @@ package com.maxrunsoftware.jezel.view;
 import static com.maxrunsoftware.jezel.Util.*;
 
 import java.io.IOException;
-import java.util.ArrayList;
 
 import com.maxrunsoftware.jezel.model.CommandLogJob;
 import com.maxrunsoftware.jezel.model.SchedulerJob;
@@ -37,29 +36,39 @@ public class CommandLogJobServlet extends ServletBase {
 		var schedulerJobId = getParameterInt(request, SchedulerJob.ID);
 
 		try (var session = db.openSession()) {
-			var commandLogJobs = new ArrayList<CommandLogJob>();
+			var commandLogJobs = createArrayBuilder();
+			var count = 0;
 
 			if (commandLogJobId != null) {
 				// return 1
 				var commandLogJob = getById(CommandLogJob.class, session, commandLogJobId);
-				if (commandLogJob != null) commandLogJobs.add(commandLogJob);
+				if (commandLogJob != null) {
+					commandLogJobs.add(commandLogJob.toJson());
+					count++;
+				}
 			} else if (schedulerJobId != null) {
 				// return all logs for job
-				for (var commandLogJob : getAll(CommandLogJob.class, session)) {
-					if (schedulerJobId.equals(commandLogJob.getSchedulerJob().getSchedulerJobId())) { commandLogJobs.add(commandLogJob); }
+				for (var commandLogJob : getAllWhereReadOnly(CommandLogJob.class, session, SchedulerJob.NAME + "." + SchedulerJob.ID, schedulerJobId)) {
+					commandLogJobs.add(commandLogJob.toJson());
+					count++;
 				}
 			} else {
-				// return all logs
-				for (var commandLogJob : getAll(CommandLogJob.class, session)) {
-					commandLogJobs.add(commandLogJob);
+				// return all logs, serializing and evicting each row as it streams in
+				try (var stream = streamAll(CommandLogJob.class, session)) {
+					for (var it = stream.iterator(); it.hasNext();) {
+						var commandLogJob = it.next();
+						commandLogJobs.add(commandLogJob.toJson());
+						session.evict(commandLogJob);
+						count++;
+					}
 				}
 			}
 
 			var json = createObjectBuilder()
 					.add(RESPONSE_STATUS, RESPONSE_STATUS_SUCCESS)
-					.add(RESPONSE_MESSAGE, "Found " + commandLogJobs.size() + " CommandLogJobs");
+					.add(RESPONSE_MESSAGE, "Found " + count + " CommandLogJobs");
 
-			json.add(CommandLogJob.NAME, createArrayBuilder(commandLogJobs));
+			json.add(CommandLogJob.NAME, commandLogJobs);
 			writeResponse(response, json);
 		}
 	}
@@ -18,7 +18,6 @@ package com.maxrunsoftware.jezel.view;
 import static com.maxrunsoftware.jezel.Util.*;
 
 import java.io.IOException;
-import java.util.Collections;
 import java.util.Map;
 
 import com.maxrunsoftware.jezel.action.CommandParameter;
@@ -41,8 +40,9 @@ public class ConfigurationItemServlet extends ServletBase {
 		}
 
 		var arrayBuilder = createArrayBuilder();
-		for (var key : map.keySet()) {
-			var mapValue = map.get(key);
+		for (var entry : map.entrySet()) {
+			var key = entry.getKey();
+			var mapValue = entry.getValue();
 			var o = createObjectBuilder();
 			o.add("name", key);
 			o.add("value", coalesce(mapValue, ""));
@@ -63,9 +63,10 @@ public class ConfigurationItemServlet extends ServletBase {
 	protected void doPostAuthorized(HttpServletRequest request, HttpServletResponse response) throws ServletException, IOException {
 		try (var session = db.openSession()) {
 
-			for (var pName : Collections.list(request.getParameterNames())) {
-				var pValue = trimOrNull(request.getParameter(pName));
-				pName = trimOrNull(pName);
+			for (var parameter : request.getParameterMap().entrySet()) {
+				var pValues = parameter.getValue();
+				var pValue = pValues.length == 0 ? null : trimOrNull(pValues[0]);
+				var pName = trimOrNull(parameter.getKey());
 				if (pName == null) continue;
 				ConfigurationItem.setValueExisting(session, pName, pValue);
 
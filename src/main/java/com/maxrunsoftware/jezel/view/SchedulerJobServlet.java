@@ -37,7 +37,7 @@ public class SchedulerJobServlet extends ServletBase {
 
 			var schedulerJobs = new ArrayList<SchedulerJob>();
 			if (schedulerJobId == null) {
-				schedulerJobs.addAll(getAll(SchedulerJob.class, session));
+				schedulerJobs.addAll(getAllReadOnly(SchedulerJob.class, session));
 			} else {
 				var schedulerJob = getById(SchedulerJob.class, session, schedulerJobId);
 				if (schedulerJob != null) { schedulerJobs.add(schedulerJob); }
@@ -39,7 +39,10 @@ public class SchedulerScheduleServlet extends ServletBase {
 		try (var session = db.openSession()) {
 
 			var schedulerSchedules = new ArrayList<SchedulerSchedule>();
-			for (var schedulerSchedule : getAll(SchedulerSchedule.class, session)) {
+			var all = schedulerJobId == null
+					? getAllReadOnly(SchedulerSchedule.class, session)
+					: getAllWhereReadOnly(SchedulerSchedule.class, session, SchedulerJob.NAME + "." + SchedulerJob.ID, schedulerJobId);
+			for (var schedulerSchedule : all) {
 				boolean shouldAdd = true;
 				if (schedulerScheduleId != null) {
 
@@ -49,14 +52,6 @@ public class SchedulerScheduleServlet extends ServletBase {
 					}
 				}
 
-				if (schedulerJobId != null) {
-
-					if (((int) schedulerJobId) != schedulerSchedule.getSchedulerJob().getSchedulerJobId()) {
-
-						shouldAdd = false;
-					}
-				}
-
 				if (shouldAdd) schedulerSchedules.add(schedulerSchedule);
 
 			}
@@ -64,19 +64,25 @@ public abstract class ServletBase extends com.maxrunsoftware.jezel.util.ServletB
 	}
 
 	protected static void writeResponse(HttpServletResponse response, JsonObject json) {
-		writeResponse(response, toJsonString(json, true));
+		writeResponse(response, json, HttpServletResponse.SC_OK);
 	}
 
 	protected static void writeResponse(HttpServletResponse response, JsonObjectBuilder json) {
-		writeResponse(response, toJsonString(json, true));
+		writeResponse(response, json.build(), HttpServletResponse.SC_OK);
 	}
 
 	protected static void writeResponse(HttpServletResponse response, JsonObject json, int statusCode) {
-		writeResponse(response, toJsonString(json, true), statusCode, Constant.CONTENTTYPE_JSON);
+		if (LOG.isTraceEnabled()) LOG.trace("Writing response [" + statusCode + "]: " + toJsonString(json, true));
+		prepareResponse(response, statusCode, Constant.CONTENTTYPE_JSON);
+		try {
+			writeJson(json, response.getWriter(), true);
+		} catch (IOException ioe) {
+			LOG.error("Error writing response", ioe);
+		}
 	}
 
 	protected static void writeResponse(HttpServletResponse response, JsonObjectBuilder json, int statusCode) {
-		writeResponse(response, toJsonString(json, true), statusCode, Constant.CONTENTTYPE_JSON);
+		writeResponse(response, json.build(), statusCode);
 	}
 
 	protected static void writeResponse(HttpServletResponse response, String status, String message, int statusCode) {
@@ -88,7 +94,7 @@ public abstract class ServletBase extends com.maxrunsoftware.jezel.util.ServletB
 
 	private boolean authorize(HttpServletRequest request, HttpServletResponse response) {
 		var authHeader = request.getHeader(HEADER_AUTHORIZATION);
-		LOG.debug(HEADER_AUTHORIZATION + ": " + authHeader);
+		LOG.debug("{}: {}", HEADER_AUTHORIZATION, authHeader);
 
 		var authBearer = httpAuthorizationDecodeBearer(authHeader);
 		String errorMessage = null;
@@ -115,7 +121,7 @@ public abstract class ServletBase extends com.maxrunsoftware.jezel.util.ServletB
 
 	@Override
 	protected void doGet(HttpServletRequest request, HttpServletResponse response) throws ServletException, IOException {
-		LOG.debug("GET: " + getFullURL(request));
+		if (LOG.isDebugEnabled()) LOG.debug("GET: " + getFullURL(request));
 		if (authorize(request, response)) { doGetAuthorized(request, response); }
 	}
 
@@ -125,7 +131,7 @@ public abstract class ServletBase extends com.maxrunsoftware.jezel.util.ServletB
 
 	@Override
 	protected void doPut(HttpServletRequest request, HttpServletResponse response) throws ServletException, IOException {
-		LOG.debug("PUT: " + getFullURL(request));
+		if (LOG.isDebugEnabled()) LOG.debug("PUT: " + getFullURL(request));
 		if (authorize(request, response)) { doPutAuthorized(request, response); }
 	}
 
@@ -135,7 +141,7 @@ public abstract class ServletBase extends com.maxrunsoftware.jezel.util.ServletB
 
 	@Override
 	protected void doPost(HttpServletRequest request, HttpServletResponse response) throws ServletException, IOException {
-		LOG.debug("POST: " + getFullURL(request));
+		if (LOG.isDebugEnabled()) LOG.debug("POST: " + getFullURL(request));
 		if (authorize(request, response)) { doPostAuthorized(request, response); }
 	}
 
@@ -145,7 +151,7 @@ public abstract class ServletBase extends com.maxrunsoftware.jezel.util.ServletB
 
 	@Override
 	protected void doDelete(HttpServletRequest request, HttpServletResponse response) throws ServletException, IOException {
-		LOG.debug("DELETE: " + getFullURL(request));
+		if (LOG.isDebugEnabled()) LOG.debug("DELETE: " + getFullURL(request));
 		if (authorize(request, response)) { doDeleteAuthorized(request, response); }
 	}
 
@@ -18,9 +18,6 @@ package com.maxrunsoftware.jezel.view;
 import static com.maxrunsoftware.jezel.Util.*;
 
 import java.io.IOException;
-import java.util.UUID;
-
-import javax.json.Json;
 
 import jakarta.servlet.ServletException;
 import jakarta.servlet.http.HttpServletRequest;
@@ -62,8 +59,9 @@ public class SessionServlet extends ServletBase {
 			return;
 		}
 		if (!settingPass.equals(pass)) {
-			LOG.debug("Invalid password: " + pass);
+			LOG.debug("Invalid password for user: " + user);
 			unauthorized(response);
+			return;
 		}
 
 		authorized(response);
@@ -71,11 +69,11 @@ public class SessionServlet extends ServletBase {
 
 	private void authorized(HttpServletResponse response) throws IOException {
 
-		var bearer = UUID.randomUUID().toString().replace("-", "");
+		var bearer = asHex(randomUUID());
 		LOG.debug("Authorized: " + bearer);
 		this.bearer.addBearer(bearer);
 
-		var json = Json.createObjectBuilder()
+		var json = createObjectBuilder()
 				.add("status", RESPONSE_STATUS_AUTHORIZED)
 				.add("bearer", bearer);
 
@@ -19,7 +19,6 @@ import static com.maxrunsoftware.jezel.Util.*;
 import static j2html.TagCreator.*;
 
 import java.io.IOException;
-import java.util.Collections;
 import java.util.TreeMap;
 
 import org.apache.commons.lang3.StringUtils;
@@ -61,39 +60,40 @@ public class ConfigServlet extends ServletBase {
 			var value = valueObj == null ? "" : valueObj.toString();
 
 			var param = configItem.parameter();
-			if (param == null || equalsAny(param.getType(), CommandParameter.TYPE_STRING, CommandParameter.TYPE_FILENAME)) {
-				sb.append(input()
-						.withType("text")
-						.withId(idValue).withName(idValue)
-						.withStyle(Constant.STYLE_FONT_MONO)
-						.withValue(value));
-
-			} else if (param.getType().equalsIgnoreCase(CommandParameter.TYPE_TEXT)) {
-				sb.append(textarea()
+			var type = param == null ? null : param.getType();
+			switch (coalesce(type, CommandParameter.TYPE_STRING)) {
+				case CommandParameter.TYPE_TEXT -> sb.append(textarea()
 						.withId(idValue).withName(idValue)
 						.withRows("2").withCols("50")
 						.withStyle(Constant.STYLE_FONT_MONO)
 						.withText(value));
 
-			} else if (param.getType().equalsIgnoreCase(CommandParameter.TYPE_INT)) {
-				sb.append(input()
+				case CommandParameter.TYPE_INT -> sb.append(input()
 						.withType("number")
 						.withId(idValue).withName(idValue)
 						.withStyle(Constant.STYLE_FONT_MONO)
 						.withMin(param.getMinValue() == null ? "0" : param.getMinValue().toString())
 						.withMax(param.getMaxValue() == null ? ("" + Integer.MAX_VALUE) : param.getMaxValue().toString())
 						.withValue(value));
-			} else if (param.getType().equalsIgnoreCase(CommandParameter.TYPE_BOOL)) {
-				sb.append(input()
+
+				case CommandParameter.TYPE_BOOL -> sb.append(input()
 						.withType("checkbox")
 						.withId(idValue).withName(idValue)
 						.withCondChecked(value == null ? false : parseBoolean(value)));
-			} else if (param.getType().equalsIgnoreCase(CommandParameter.TYPE_OPTION)) {
-				sb.append("<select id=\"" + idValue + "\" name=\"" + idValue + "\">");
-				for (var optionValue : param.getOptionValues()) {
-					sb.append("<option value=\"" + optionValue + "\">" + optionValue + "</option>");
+
+				case CommandParameter.TYPE_OPTION -> {
+					sb.append("<select id=\"" + idValue + "\" name=\"" + idValue + "\">");
+					for (var optionValue : param.getOptionValues()) {
+						sb.append("<option value=\"" + optionValue + "\">" + optionValue + "</option>");
+					}
+					sb.append("</select>");
 				}
-				sb.append("</select>");
+
+				default -> sb.append(input()
+						.withType("text")
+						.withId(idValue).withName(idValue)
+						.withStyle(Constant.STYLE_FONT_MONO)
+						.withValue(value));
 			}
 
 			sb.append("</div>");
@@ -114,25 +114,22 @@ public class ConfigServlet extends ServletBase {
 		var mapNames = new TreeMap<Integer, String>();
 		var mapValues = new TreeMap<Integer, String>();
 
-		for (var pName : Collections.list(request.getParameterNames())) {
-			var pValue = trimOrNull(request.getParameter(pName));
-			LOG.debug(pName + ": " + pValue);
+		for (var parameter : request.getParameterMap().entrySet()) {
+			var pValues = parameter.getValue();
+			var pValue = pValues.length == 0 ? null : trimOrNull(pValues[0]);
+			var pName = parameter.getKey();
+			LOG.debug("{}: {}", pName, pValue);
 			pName = trimOrNull(pName);
-			if (pName == null) continue;
-			pName = pName.toLowerCase();
-			if (pName.length() != 5) continue;
-			if (pName.endsWith("n") || pName.endsWith("v")) {
-				// NOOP
-			} else {
-				continue;
-			}
+			if (pName == null || pName.length() != 5) continue;
+			var partType = Character.toLowerCase(pName.charAt(4));
+			if (partType != 'n' && partType != 'v') continue;
+			var partNum = parseFieldIndex(pName);
+			if (partNum < 0) continue;
 
-			var partNum = parseInt(pName.substring(0, 4));
-			var partType = pName.substring(4);
-			if (partType.equals("n")) {
+			if (partType == 'n') {
 				if (pValue == null) continue;
 				mapNames.put(partNum, pValue);
-			} else if (partType.equals("v")) {
+			} else {
 				// Add to value map
 				mapValues.put(partNum, pValue);
 			}
@@ -151,6 +148,16 @@ public class ConfigServlet extends ServletBase {
 		doGet(request, response);
 	}
 
+	private static int parseFieldIndex(String pName) {
+		var index = 0;
+		for (int i = 0; i < 4; i++) {
+			var c = pName.charAt(i);
+			if (c < '0' || c > '9') return -1;
+			index = index * 10 + (c - '0');
+		}
+		return index;
+	}
+
 	@Override
 	protected Nav getNav() {
 		return Nav.CONFIG;
@@ -236,24 +236,15 @@ public class DataService {
 		return new ArrayList<ConfigItemCommandParameter>(map.values());
 	}
 
-	private static record ConfigItem(String name, String value) {}
-
 	public void saveConfigurationItems(Map<String, String> map) throws IOException {
-
-		var list = new ArrayList<ConfigItem>();
-		for (var name : map.keySet()) {
-			list.add(new ConfigItem(name, coalesce(map.get(name), "")));
+		var pars = new ArrayList<ParamNameValue>(map.size());
+		for (var entry : map.entrySet()) {
+			pars.add(par(entry.getKey(), coalesce(entry.getValue(), "")));
 		}
 
-		var listParts = Lists.partition(list, 10);
-
-		for (var listPart : listParts) {
-			var pars = new ArrayList<ParamNameValue>();
-			for (var configItem : listPart) {
-				pars.add(par(configItem.name, configItem.value));
-			}
+		for (var parsPart : Lists.partition(pars, 10)) {
 			LOG.debug("Issuing POST to add new configurations");
-			client.get(Verb.POST, "config", pars);
+			client.get(Verb.POST, "config", parsPart);
 		}
 
 	}
@@ -31,6 +31,7 @@ import jakarta.servlet.http.HttpServletResponse;
 public class JobServlet extends ServletBase {
 	private static final long serialVersionUID = 6343839739720974399L;
 	private static final org.slf4j.Logger LOG = org.slf4j.LoggerFactory.getLogger(JobServlet.class);
+	private static final List<String> JOB_COLUMNS = List.of("", "JobId", "Name", "Group", "Schedules", "Actions", "Logs", "Enabled");
 
 	@Override
 	protected void doGet(HttpServletRequest request, HttpServletResponse response) throws ServletException, IOException {
@@ -91,12 +92,11 @@ public class JobServlet extends ServletBase {
 
 		;
 
-		writeResponse(response, title, html.renderFormatted(), 200);
+		writeResponse(response, title, render(html), 200);
 
 	}
 
 	private void doGetShowJobAll(HttpServletRequest request, HttpServletResponse response) throws ServletException, IOException {
-		var headers = List.of("", "JobId", "Name", "Group", "Schedules", "Actions", "Logs", "Enabled");
 		var jobsAll = data.getSchedulerJob(null);
 		var map = new TreeMap<String, ArrayList<SchedulerJob>>();
 		for (var job : jobsAll) {
@@ -117,7 +117,7 @@ public class JobServlet extends ServletBase {
 			sb.append("<p>");
 			sb.append(h2(key));
 			var table = table(attrs("#table-example"),
-					thead(each(headers, h -> th(h))),
+					thead(each(JOB_COLUMNS, h -> th(h))),
 					tbody(each(jobs, i -> tr(
 							td(a("Edit").withHref("/jobs?schedulerJobId=" + i.getSchedulerJobId())),
 							td("" + i.getSchedulerJobId()),
@@ -129,7 +129,7 @@ public class JobServlet extends ServletBase {
 							td(input().attr("type", "checkbox").attr("disabled", "disabled").withCondChecked(!i.isDisabled())
 							// End of row
 							)))));
-			sb.append(table.renderFormatted());
+			sb.append(render(table));
 			sb.append("</p><br><br>");
 		}
 		writeResponse(response, "Jobs", sb.toString(), 200);
@@ -40,6 +40,34 @@ public class LogJobServlet extends ServletBase {
 	private static final long serialVersionUID = 5343838486663771389L;
 	private static final org.slf4j.Logger LOG = org.slf4j.LoggerFactory.getLogger(LogJobServlet.class);
 
+	private static final DateTimeFormatter DATETIME_FORMATTER = DateTimeFormatter.ofPattern("yyyy-MM-dd HH:mm:ss");
+
+	private static final List<String> LOG_ACTIONS_COLUMNS = List.of(
+			"Action",
+			"Type",
+			"Timestamp",
+			"Level",
+			"Message"
+
+	);
+
+	private static final List<String> LOG_JOBS_COLUMNS = List.of("", "Start", "End", "Is Error");
+
+	private static final Table.HtmlFormatter LOG_ACTIONS_FORMATTER = new Table.HtmlFormatter() {
+		private static final String COLGROUP = "<colgroup>"
+				+ "<col style=\"width: 15%;\">"
+				+ "<col style=\"width: 10%;\">"
+				+ "<col style=\"width: 15%;\">"
+				+ "<col style=\"width: 10%;\">"
+				+ "<col style=\"width: 50%;\">"
+				+ "</colgroup>";
+
+		@Override
+		public void colgroup(StringBuilder sb, List<String> columns) {
+			sb.append(COLGROUP);
+		}
+	};
+
 	@Override
 	protected void doGet(HttpServletRequest request, HttpServletResponse response) throws ServletException, IOException {
 		var schedulerJobId = getParameterInt(request, SchedulerJob.ID);
@@ -62,15 +90,6 @@ public class LogJobServlet extends ServletBase {
 			return;
 		}
 
-		var columns = List.of(
-				"Action",
-				"Type",
-				"Timestamp",
-				"Level",
-				"Message"
-
-		);
-
 		var rows = new ArrayList<ArrayList<Object>>();
 
 		var commandLogJob = commandLogJobs.get(0);
@@ -109,7 +128,7 @@ public class LogJobServlet extends ServletBase {
 
 		}
 
-		var table = Table.parse(columns, rows);
+		var table = Table.parse(LOG_ACTIONS_COLUMNS, rows);
 
 		var cljhtml = p(
 				text(CommandLogAction.ID + "[" + commandLogJobId + "]"),
@@ -124,19 +143,7 @@ public class LogJobServlet extends ServletBase {
 		var sb = new StringBuilder();
 		sb.append(cljhtml);
 		sb.append("<p>");
-		var htmlFormatter = new Table.HtmlFormatter() {
-			@Override
-			public void colgroup(StringBuilder sb, List<String> columns) {
-				sb.append("<colgroup>");
-				sb.append("<col style=\"width: 15%;\">");
-				sb.append("<col style=\"width: 10%;\">");
-				sb.append("<col style=\"width: 15%;\">");
-				sb.append("<col style=\"width: 10%;\">");
-				sb.append("<col style=\"width: 50%;\">");
-				sb.append("</colgroup>");
-			}
-		};
-		sb.append(table.toHtml(htmlFormatter));
+		sb.append(table.toHtml(LOG_ACTIONS_FORMATTER));
 		sb.append("</p>");
 
 		writeResponse(response, CommandLogAction.ID + "[" + commandLogJobId + "]", sb.toString(), 200);
@@ -145,8 +152,7 @@ public class LogJobServlet extends ServletBase {
 
 	private static String format(LocalDateTime datetime) {
 		if (datetime == null) return "";
-		var formatter = DateTimeFormatter.ofPattern("yyyy-MM-dd HH:mm:ss");
-		return datetime.format(formatter);
+		return datetime.format(DATETIME_FORMATTER);
 	}
 
 	private void doGetShowLogAll(HttpServletRequest request, HttpServletResponse response, Integer schedulerJobId) throws ServletException, IOException {
@@ -173,19 +179,18 @@ public class LogJobServlet extends ServletBase {
 			sb.append("</p>");
 
 			sb.append("<p>");
-			var tableColumns = List.of("", "Start", "End", "Is Error");
 			var tableList = new ArrayList<ArrayList<String>>();
 			for (var commandLogJob2 : commandLogJobs2) {
 				var list = new ArrayList<String>();
 				var link = a("View").withHref("/logs" + parameters(CommandLogJob.ID, commandLogJob2.getCommandLogJobId()));
-				list.add(link.renderFormatted());
+				list.add(render(link));
 				list.add(commandLogJob2.getStart() != null ? format(commandLogJob2.getStart()) : "");
 				list.add(commandLogJob2.getEnd() != null ? format(commandLogJob2.getEnd()) : "");
 				list.add("" + commandLogJob2.isError());
 				tableList.add(list);
 			}
 
-			var table = Table.parse(tableColumns, tableList);
+			var table = Table.parse(LOG_JOBS_COLUMNS, tableList);
 			sb.append(table.toHtml());
 			sb.append("</p>");
 		}
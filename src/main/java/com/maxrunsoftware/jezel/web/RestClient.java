@@ -20,6 +20,7 @@ import static com.maxrunsoftware.jezel.Util.*;
 
 import java.io.IOException;
 import java.util.ArrayList;
+import java.util.Collection;
 
 import javax.json.JsonObject;
 
@@ -45,21 +46,20 @@ public class RestClient {
 
 	private String bearer;
 	private final SettingService settings;
+	private final String host;
+	private CloseableHttpClient client;
 
 	public RestClient(SettingService settings) {
 		this.settings = checkNotNull(settings);
-	}
-
-	private String getHost() {
-		var h = settings.getRestUrl();
+		var h = checkNotNull(settings.getRestUrl(), "RestUrl not configured");
 		if (!h.endsWith("/")) h = h + "/";
-		return h;
+		this.host = h;
 	}
 
 	public static record ParamNameValue(String key, Object value) {}
 
 	private void login() throws Exception {
-		var response = get(Verb.POST, getHost() + "session", settings.getRestUsername(), settings.getRestPassword());
+		var response = get(Verb.POST, host + "session", settings.getRestUsername(), settings.getRestPassword());
 		var o = response.jsonObject;
 		this.bearer = trimOrNull(o.getString("bearer"));
 	}
@@ -75,18 +75,17 @@ public class RestClient {
 	}
 
 	public Response get(Verb verb, String hostSuffix, Iterable<ParamNameValue> params) throws IOException {
+		if (params instanceof Collection<ParamNameValue> collection) return get(verb, hostSuffix, collection.toArray(ParamNameValue[]::new));
+
 		var list = new ArrayList<ParamNameValue>();
 		for (var param : params) {
 			list.add(param);
 		}
-
-		var array = list.toArray(ParamNameValue[]::new);
-		return get(verb, hostSuffix, array);
+		return get(verb, hostSuffix, list.toArray(ParamNameValue[]::new));
 	}
 
 	public Response get(Verb verb, String hostSuffix, ParamNameValue... params) throws IOException {
-		var host = getHost();
-		host = host + hostSuffix;
+		var url = new StringBuilder(host).append(hostSuffix);
 		try {
 			if (bearer == null) login();
 
@@ -98,14 +97,15 @@ public class RestClient {
 					foundOne = true;
 				}
 			}
-			if (foundOne) { host = host + uribuilder.toString(); }
-			LOG.debug(verb.toString().toUpperCase() + "[" + bearer + "]: " + host);
+			if (foundOne) { url.append(uribuilder.toString()); }
+			var target = url.toString();
+			LOG.debug("{}[{}]: {}", verb, bearer, target);
 
-			var response = get(verb, host, bearer);
+			var response = get(verb, target, bearer);
 			if (response.code == 401) {
 				// Old bearer token, get a new one
 				login();
-				response = get(verb, host, bearer);
+				response = get(verb, target, bearer);
 				if (response.code == 401) {
 					// Bad username or password
 					var msg = "Received 401 attempting to login";
@@ -130,11 +130,12 @@ public class RestClient {
 	private Response get(Verb verb, String host, String username, String password, String bearer) throws Exception {
 		checkNotNull(host);
 
-		HttpUriRequestBase action;
-		if (verb.equals(Verb.DELETE)) action = new HttpDelete(host);
-		else if (verb.equals(Verb.POST)) action = new HttpPost(host);
-		else if (verb.equals(Verb.PUT)) action = new HttpPut(host);
-		else action = new HttpGet(host);
+		HttpUriRequestBase action = switch (verb) {
+			case DELETE -> new HttpDelete(host);
+			case POST -> new HttpPost(host);
+			case PUT -> new HttpPut(host);
+			default -> new HttpGet(host);
+		};
 
 		if (username != null) {
 			LOG.debug("Username supplied so adding Authorization header");
@@ -150,31 +151,37 @@ public class RestClient {
 		String json = null;
 		String error = null;
 
-		try (CloseableHttpClient httpclient = createClient()) {
-			LOG.trace("HttpClient created: " + httpclient.getClass().getName());
-			try (CloseableHttpResponse response = httpclient.execute(action)) {
-				LOG.trace("Received response: " + response.getClass().getName());
-				code = response.getCode();
-				HttpEntity httpEntity = response.getEntity();
-				json = EntityUtils.toString(httpEntity);
-
-				if (settings.getRestShowRest()) { LOG.debug(json); }
-				try {
-					o = fromJsonString(json);
-				} catch (Exception e) {
-					LOG.debug("Error processing response to JSON", e);
-					// Since we couldn't deserialize then the message is probably an error
-					error = json;
-					LOG.warn(error);
-				}
-
+		var httpclient = getClient();
+		try (CloseableHttpResponse response = httpclient.execute(action)) {
+			LOG.trace("Received response: {}", response.getClass().getName());
+			code = response.getCode();
+			HttpEntity httpEntity = response.getEntity();
+			json = EntityUtils.toString(httpEntity);
+
+			if (LOG.isDebugEnabled() && settings.getRestShowRest()) { LOG.debug(json); }
+			try {
+				o = fromJsonString(json);
+			} catch (Exception e) {
+				LOG.debug("Error processing response to JSON", e);
+				// Since we couldn't deserialize then the message is probably an error
+				error = json;
+				LOG.warn(error);
 			}
+
 		}
 		if (error != null) throw new IOException(error);
 		return new Response(code, json, o);
 
 	}
 
+	private synchronized CloseableHttpClient getClient() throws Exception {
+		if (client == null) {
+			client = createClient();
+			LOG.trace("HttpClient created: {}", client.getClass().getName());
+		}
+		return client;
+	}
+
 	private CloseableHttpClient createClient() throws Exception {
 
 		SSLContextBuilder sshbuilder = new SSLContextBuilder();
@@ -23,8 +23,6 @@ import java.util.ArrayList;
 import java.util.Collections;
 import java.util.List;
 
-import org.apache.commons.lang3.StringUtils;
-
 import com.maxrunsoftware.jezel.model.SchedulerJob;
 import com.maxrunsoftware.jezel.model.SchedulerSchedule;
 import com.maxrunsoftware.jezel.util.Table;
@@ -36,6 +34,7 @@ import jakarta.servlet.http.HttpServletResponse;
 public class ScheduleServlet extends ServletBase {
 	private static final long serialVersionUID = 1285903727709923745L;
 	private static final org.slf4j.Logger LOG = org.slf4j.LoggerFactory.getLogger(ScheduleServlet.class);
+	private static final List<String> SCHEDULE_COLUMNS = List.of("", "", "SchedulerScheduleId", "SchedulerJobId", "Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Time", "Enabled");
 
 	@Override
 	protected void doGet(HttpServletRequest request, HttpServletResponse response) throws ServletException, IOException {
@@ -195,7 +194,7 @@ public class ScheduleServlet extends ServletBase {
 			errorMessage = "<p class=\"errorMessage\">ERROR: " + errorMessage + "</p>";
 		}
 
-		writeResponse(response, title, errorMessage + html.renderFormatted(), 200);
+		writeResponse(response, title, errorMessage + render(html), 200);
 
 	}
 
@@ -220,8 +219,14 @@ public class ScheduleServlet extends ServletBase {
 		writeResponse(response, "Schedules", sb.toString(), 200);
 	}
 
+	private static final String CHECKBOX_CHECKED = input().attr("type", "checkbox").attr("disabled", "disabled").withCondChecked(true).render();
+	private static final String CHECKBOX_UNCHECKED = input().attr("type", "checkbox").attr("disabled", "disabled").withCondChecked(false).render();
+
+	private static String checkbox(boolean checked) {
+		return checked ? CHECKBOX_CHECKED : CHECKBOX_UNCHECKED;
+	}
+
 	private Table toTable(Iterable<SchedulerSchedule> schedules) {
-		var cols = List.of("", "", "SchedulerScheduleId", "SchedulerJobId", "Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Time", "Enabled");
 		var rows = new ArrayList<List<Object>>();
 
 		for (var schedule : schedules) {
@@ -235,26 +240,26 @@ public class ScheduleServlet extends ServletBase {
 			var ampm = hour >= 12 ? "pm" : "am";
 			if (hour > 12) hour = hour - 12;
 			if (hour == 0) hour = 12;
-			var minute = StringUtils.right("00" + schedule.getMinute(), 2);
+			var minute = padTwoDigits(schedule.getMinute());
 			var time = "" + hour + ":" + minute + " " + ampm;
 
 			list.add(a("Edit").withHref("/schedules" + parsEdit));
 			list.add(a("Delete").withHref("/schedules" + parsDelete));
 			list.add(a("Schedule[" + schedulerScheduleId + "]").withHref("/schedules" + parsEdit));
 			list.add(a("Job[" + schedulerJobId + "]").withHref("/jobs" + parameters(SchedulerJob.ID, schedulerJobId)));
-			list.add(input().attr("type", "checkbox").attr("disabled", "disabled").withCondChecked(schedule.isSunday()));
-			list.add(input().attr("type", "checkbox").attr("disabled", "disabled").withCondChecked(schedule.isMonday()));
-			list.add(input().attr("type", "checkbox").attr("disabled", "disabled").withCondChecked(schedule.isTuesday()));
-			list.add(input().attr("type", "checkbox").attr("disabled", "disabled").withCondChecked(schedule.isWednesday()));
-			list.add(input().attr("type", "checkbox").attr("disabled", "disabled").withCondChecked(schedule.isThursday()));
-			list.add(input().attr("type", "checkbox").attr("disabled", "disabled").withCondChecked(schedule.isFriday()));
-			list.add(input().attr("type", "checkbox").attr("disabled", "disabled").withCondChecked(schedule.isSaturday()));
+			list.add(checkbox(schedule.isSunday()));
+			list.add(checkbox(schedule.isMonday()));
+			list.add(checkbox(schedule.isTuesday()));
+			list.add(checkbox(schedule.isWednesday()));
+			list.add(checkbox(schedule.isThursday()));
+			list.add(checkbox(schedule.isFriday()));
+			list.add(checkbox(schedule.isSaturday()));
 			list.add(time);
-			list.add(input().attr("type", "checkbox").attr("disabled", "disabled").withCondChecked(!schedule.isDisabled()));
+			list.add(checkbox(!schedule.isDisabled()));
 			rows.add(list);
 		}
 
-		return Table.parse(cols, rows);
+		return Table.parse(SCHEDULE_COLUMNS, rows);
 	}
 
 	@Override
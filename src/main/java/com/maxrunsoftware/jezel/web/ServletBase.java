@@ -17,11 +17,14 @@ package com.maxrunsoftware.jezel.web;
 
 import static com.maxrunsoftware.jezel.Util.*;
 
-import java.io.IOException;
+import java.util.EnumMap;
+import java.util.List;
+import java.util.Map;
 
 import com.maxrunsoftware.jezel.Constant;
 import com.maxrunsoftware.jezel.SettingService;
 
+import j2html.tags.DomContent;
 import jakarta.servlet.ServletException;
 import jakarta.servlet.http.HttpServletResponse;
 
@@ -102,11 +105,17 @@ public abstract class ServletBase extends com.maxrunsoftware.jezel.util.ServletB
 
 	protected SettingService settings;
 	protected DataService data;
+	private boolean prettyHtml;
 
 	@Override
 	public void init() throws ServletException {
 		settings = getResource(SettingService.class);
 		data = getResource(DataService.class);
+		prettyHtml = settings.getWebPrettyHtml();
+	}
+
+	protected String render(DomContent html) {
+		return prettyHtml ? html.renderFormatted() : html.render();
 	}
 
 	protected void writeResponse(HttpServletResponse response, String html) {
@@ -123,62 +132,71 @@ public abstract class ServletBase extends com.maxrunsoftware.jezel.util.ServletB
 
 	protected abstract Nav getNav();
 
+	private static record NavLink(Nav nav, String href, String label) {}
+
+	private static final List<NavLink> NAV_LINKS = List.of(
+			new NavLink(Nav.HOME, "/", "Home"),
+			new NavLink(Nav.JOBS, "/jobs", "Jobs"),
+			new NavLink(Nav.SCHEDULES, "/schedules", "Schedules"),
+			new NavLink(Nav.LOGS, "/logs", "Logs"),
+			new NavLink(Nav.CONFIG, "/config", "Configuration"),
+			new NavLink(Nav.LOGOUT, "/logout", "Logout"));
+
+	private static final Map<Nav, String> TOP_NAVS = new EnumMap<Nav, String>(Nav.class);
+	static {
+		for (var nav : Nav.values()) {
+			TOP_NAVS.put(nav, createTopNav(nav));
+		}
+	}
+
+	private static String topNav(Nav nav) {
+		return TOP_NAVS.get(coalesce(nav, Nav.NONE));
+	}
+
+	private static String createTopNav(Nav nav) {
+		var sb = new StringBuilder();
+		sb.append("<div class=\"topnav\">\n");
+		for (var link : NAV_LINKS) {
+			sb.append("\t<a ");
+			if (link.nav() == nav) sb.append("class=\"active\" ");
+			sb.append("href=\"").append(link.href()).append("\">").append(link.label()).append("</a>\n");
+		}
+		sb.append("</div>\n");
+		return sb.toString();
+	}
+
+	private static final String PAGE_START = """
+			<html dir="ltr" lang="en">
+				<head>
+					<meta charset="utf-8">
+					<title>""";
+
+	private static final String PAGE_AFTER_TITLE = "</title>\n"
+			+ "\t\t<style>" + CSS + "</style>\n"
+			+ "\t\t<script>" + JAVASCRIPT + "</script>\n"
+			+ "\t</head>\n"
+			+ "\t<body>\n"
+			+ "\t\t";
+
+	private static final String PAGE_END = """
+
+				</body>
+			</html>""";
+
 	protected void writeResponse(HttpServletResponse response, String title, String html, int statusCode) {
 		html = coalesce(trimOrNull(html), "Missing HTML");
-		var topNav = """
-				<div class="topnav">
-					<a ${activeHome} href="/">Home</a>
-					<a ${activeJobs} href="/jobs">Jobs</a>
-					<a ${activeSchedules} href="/schedules">Schedules</a>
-					<a ${activeLogs} href="/logs">Logs</a>
-					<a ${activeConfig} href="/config">Configuration</a>
-					<a ${activeLogout} href="/logout">Logout</a>
-				</div>
-				""";
-		var active = "class=\"active\"";
-		topNav = topNav.replace("${activeHome}", getNav().equals(Nav.HOME) ? active : "");
-		topNav = topNav.replace("${activeJobs}", getNav().equals(Nav.JOBS) ? active : "");
-		topNav = topNav.replace("${activeSchedules}", getNav().equals(Nav.SCHEDULES) ? active : "");
-		topNav = topNav.replace("${activeLogs}", getNav().equals(Nav.LOGS) ? active : "");
-		topNav = topNav.replace("${activeConfig}", getNav().equals(Nav.CONFIG) ? active : "");
-		topNav = topNav.replace("${activeLogout}", getNav().equals(Nav.LOGOUT) ? active : "");
-
-		var str = """
-				<html dir="ltr" lang="en">
-					<head>
-						<meta charset="utf-8">
-						<title>${title}</title>
-						<style>${style}</style>
-						<script>${script}</script>
-					</head>
-					<body>
-						${topNav}
-						<br>
-
-						${body}
-					</body>
-				</html>
-				""";
-
-		str = str.replace("${title}", title);
-		str = str.replace("${style}", CSS);
-		str = str.replace("${script}", JAVASCRIPT);
-		str = str.replace("${body}", html);
-		str = str.replace("${topNav}", topNav);
-		str = trimOrNull(str);
-		html = str;
-
-		LOG.trace("Writing response [" + statusCode + "]: " + html);
-		response.setContentType(Constant.CONTENTTYPE_HTML);
-		response.setCharacterEncoding(Constant.ENCODING_UTF8);
-		response.setStatus(statusCode);
-		response.addHeader("Cache-Control", "no-cache");
-		response.addHeader("Content-Language", "en-US");
-		try {
-			response.getWriter().print(html);
-		} catch (IOException ioe) {
-			LOG.error("Error writing response", ioe);
-		}
+		var topNav = topNav(getNav());
+
+		var sb = new StringBuilder(PAGE_START.length() + PAGE_AFTER_TITLE.length() + PAGE_END.length() + topNav.length() + html.length() + 64);
+		sb.append(PAGE_START);
+		sb.append(title);
+		sb.append(PAGE_AFTER_TITLE);
+		sb.append(topNav);
+		sb.append("\t\t<br>\n\n\t\t");
+		sb.append(html);
+		sb.append(PAGE_END);
+
+		writeResponse(response, sb.toString(), statusCode, Constant.CONTENTTYPE_HTML);
 	}
 
 }
@@ -0,0 +1,148 @@
+/*
+ * Copyright (c) 2021 Max Run Software (dev@maxrunsoftware.com)
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ * 
+ * http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+package com.maxrunsoftware.jezel;
+
+import static com.maxrunsoftware.jezel.Util.*;
+import static org.junit.Assert.*;
+
+import java.nio.charset.StandardCharsets;
+import java.util.Base64;
+import java.util.List;
+import java.util.UUID;
+import java.util.regex.Pattern;
+
+import org.apache.commons.lang3.StringUtils;
+import org.junit.Test;
+
+public class UtilTest extends TestBase {
+
+	private static final List<UUID> LEADING_ZERO_UUIDS = List.of(
+			new UUID(0L, 0L),
+			new UUID(0L, 1L),
+			new UUID(1L, 0L),
+			new UUID(0x00000000ffffffffL, 0x000000000000abcdL),
+			new UUID(0x0fffffffffffffffL, 0x00f0000000000000L),
+			new UUID(-1L, -1L));
+
+	@Test
+	public void asHexMatchesUuidToString() {
+		for (int i = 0; i < 1000; i++) {
+			var uuid = randomUUID();
+			assertEquals(uuid.toString().replace("-", ""), asHex(uuid));
+		}
+		for (var uuid : LEADING_ZERO_UUIDS) {
+			assertEquals(uuid.toString().replace("-", ""), asHex(uuid));
+		}
+	}
+
+	@Test
+	public void asUUIDRoundTripsAsHex() {
+		for (int i = 0; i < 1000; i++) {
+			var uuid = randomUUID();
+			assertEquals(uuid, asUUID(asHex(uuid)));
+			assertEquals(uuid, asUUID(asHex(uuid).toUpperCase()));
+			assertEquals(uuid, asUUID(uuid.toString()));
+		}
+		for (var uuid : LEADING_ZERO_UUIDS) {
+			assertEquals(uuid, asUUID(asHex(uuid)));
+			assertEquals(uuid, asUUID(uuid.toString()));
+		}
+		assertNull(asUUID(null));
+		assertNull(asUUID("0123456789abcdef"));
+	}
+
+	private static String basic(String credentials) {
+		return "Basic " + Base64.getEncoder().encodeToString(credentials.getBytes(StandardCharsets.UTF_8));
+	}
+
+	@Test
+	public void httpAuthorizationDecodeSplitsAtFirstColon() {
+		var credential = httpAuthorizationDecode(httpAuthorizationEncode("user", "pass"));
+		assertEquals("user", credential.username);
+		assertEquals("pass", credential.password);
+
+		credential = httpAuthorizationDecode(basic("user:pa:ss"));
+		assertEquals("user", credential.username);
+		assertEquals("pa:ss", credential.password);
+
+		credential = httpAuthorizationDecode(basic(":"));
+		assertEquals("", credential.username);
+		assertEquals("", credential.password);
+	}
+
+	@Test
+	public void httpAuthorizationDecodeRejectsMissingColon() {
+		assertNull(httpAuthorizationDecode(basic("user")));
+		assertNull(httpAuthorizationDecode(basic("")));
+		assertNull(httpAuthorizationDecode(null));
+		assertNull(httpAuthorizationDecode("Bearer abc"));
+	}
+
+	@Test
+	public void padTwoDigitsMatchesRightPadding() {
+		for (int i = 0; i < 100; i++) {
+			assertEquals(StringUtils.right("00" + i, 2), padTwoDigits(i));
+		}
+	}
+
+	@Test
+	public void splitTreatsSeparatorLiterally() {
+		assertArrayEquals(new String[] { "a", "b", "c" }, split("a.b.c", "."));
+		assertArrayEquals(new String[] { "a", "b", "", "c" }, split("a|b||c", "|"));
+		assertArrayEquals(new String[] { "a", "b" }, split("a.b..", "."));
+
+		var cases = new String[][] {
+				{ "a.b.c", "." },
+				{ "a|b||c|", "|" },
+				{ "x*y*z", "*" },
+				{ "1+2+3", "+" },
+				{ "[a][b]", "][" },
+				{ "a\\b\\c", "\\" },
+				{ "$a$", "$" },
+				{ "a, b,, c", ", " },
+				{ "", "." },
+				{ "abc", "." }
+		};
+		for (var c : cases) {
+			assertArrayEquals(c[0] + " / " + c[1], c[0].split(Pattern.quote(c[1])), split(c[0], c[1]));
+			// second call is served from the pattern cache
+			assertArrayEquals(c[0] + " / " + c[1], c[0].split(Pattern.quote(c[1])), split(c[0], c[1]));
+		}
+	}
+
+	@Test
+	public void parseBooleanAcceptsEachToken() {
+		for (var token : List.of("true", "t", "yes", "y", "1", "on")) {
+			assertTrue(token, parseBoolean(token));
+			assertTrue(token, parseBoolean(token.toUpperCase()));
+		}
+		for (var token : List.of("false", "f", "no", "n", "0", "off")) {
+			assertFalse(token, parseBoolean(token));
+			assertFalse(token, parseBoolean(token.toUpperCase()));
+		}
+	}
+
+	@Test(expected = IllegalArgumentException.class)
+	public void parseBooleanRejectsUnknownToken() {
+		parseBoolean("maybe");
+	}
+
+	@Test(expected = NullPointerException.class)
+	public void parseBooleanRejectsNull() {
+		parseBoolean(null);
+	}
+
+}
@@ -0,0 +1,78 @@
+/*
+ * Copyright (c) 2021 Max Run Software (dev@maxrunsoftware.com)
+ * 
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ * 
+ * http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+package com.maxrunsoftware.jezel.model;
+
+import static com.maxrunsoftware.jezel.model.SchedulerSchedule.*;
+import static org.junit.Assert.*;
+
+import org.junit.Test;
+
+import com.maxrunsoftware.jezel.TestBase;
+
+public class SchedulerScheduleTest extends TestBase {
+
+	private static final int[] DAYS = { DAY_SUNDAY, DAY_MONDAY, DAY_TUESDAY, DAY_WEDNESDAY, DAY_THURSDAY, DAY_FRIDAY, DAY_SATURDAY };
+
+	private static boolean[] flags(SchedulerSchedule s) {
+		return new boolean[] { s.isSunday(), s.isMonday(), s.isTuesday(), s.isWednesday(), s.isThursday(), s.isFriday(), s.isSaturday() };
+	}
+
+	@Test
+	public void eachDayFlagRoundTrips() {
+		for (int i = 0; i < DAYS.length; i++) {
+			var s = new SchedulerSchedule();
+			s.setDays(DAYS[i]);
+			assertEquals(DAYS[i], s.getDays());
+
+			var flags = flags(s);
+			for (int ii = 0; ii < flags.length; ii++) {
+				assertEquals(i == ii, flags[ii]);
+			}
+		}
+	}
+
+	@Test
+	public void individualSettersMatchMask() {
+		var s = new SchedulerSchedule();
+		s.setDays(0);
+		s.setSunday(true);
+		assertEquals(DAY_SUNDAY, s.getDays());
+		s.setMonday(true);
+		s.setTuesday(true);
+		s.setWednesday(true);
+		s.setThursday(true);
+		s.setFriday(true);
+		s.setSaturday(true);
+		assertEquals(DAY_ALL, s.getDays());
+	}
+
+	@Test
+	public void everyMaskRoundTrips() {
+		for (int mask = 0; mask <= DAY_ALL; mask++) {
+			var s = new SchedulerSchedule();
+			s.setDays(mask);
+			assertEquals(mask, s.getDays());
+		}
+		var s = new SchedulerSchedule();
+		s.setDays(DAY_ALL);
+		s.setDays(0);
+		assertEquals(0, s.getDays());
+		for (var flag : flags(s)) {
+			assertFalse(flag);
+		}
+	}
+
+}